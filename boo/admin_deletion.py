@@ -185,6 +185,12 @@ def delete_comment_completely(comment_id: int, admin_user_id: int, replace_mode:
                 
                 # Delete the main comment
                 cursor.execute("DELETE FROM comments WHERE comment_id = ?", (comment_id,))
+                
+                # Keep the post's denormalized comment counter in step
+                cursor.execute(
+                    "UPDATE posts SET comment_count = comment_count - ? WHERE post_id = ?",
+                    (len(all_comment_ids), post_id)
+                )
             
             # Log the deletion action
             log_admin_deletion(
@@ -390,6 +396,12 @@ def replace_comment_with_message(comment_id: int, admin_user_id: int, replacemen
                 else:
                     raise
             
+            # Replies quote the replaced comment from their own row
+            cursor.execute(
+                "UPDATE comments SET parent_content_snippet = ? WHERE parent_comment_id = ?",
+                (replacement_message, comment_id)
+            )
+            
             # Replace replies with a different message indicating the parent was removed
             if reply_ids:
                 reply_replacement_message = "[This reply has been removed because the parent comment was removed]"
@@ -407,6 +419,13 @@ def replace_comment_with_message(comment_id: int, admin_user_id: int, replacemen
                             )
                         else:
                             raise
+                
+                # ...and whatever quotes those replies
+                reply_placeholders = ','.join(['?' for _ in reply_ids])
+                cursor.execute(
+                    f"UPDATE comments SET parent_content_snippet = ? WHERE parent_comment_id IN ({reply_placeholders})",
+                    [reply_replacement_message] + reply_ids
+                )
                 replacement_stats['replies_replaced'] = len(reply_ids)
             
             # Clear all reports for this comment and its replies
@@ -285,14 +285,15 @@ class BulkActionsManager:
             # Log deletions first
             placeholders = ','.join(['?' for _ in comment_ids])
             cursor.execute(f"""
-                SELECT comment_id, content, user_id
+                SELECT comment_id, content, user_id, post_id
                 FROM comments 
                 WHERE comment_id IN ({placeholders})
             """, comment_ids)
             
             comments_to_delete = cursor.fetchall()
+            affected_post_ids = list({row[3] for row in comments_to_delete})
             
-            for comment_id, content, user_id in comments_to_delete:
+            for comment_id, content, user_id, post_id in comments_to_delete:
                 cursor.execute("""
                     INSERT INTO moderation_log (moderator_id, target_type, target_id, action, reason)
                     VALUES (?, 'comment', ?, 'bulk_delete', ?)
@@ -305,6 +306,18 @@ class BulkActionsManager:
             """, comment_ids)
             
             deleted_count = cursor.rowcount
+            
+            # Recount the affected posts' denormalized comment counters
+            if affected_post_ids:
+                post_placeholders = ','.join(['?' for _ in affected_post_ids])
+                cursor.execute(f"""
+                    UPDATE posts 
+                    SET comment_count = (
+                        SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.post_id
+                    )
+                    WHERE post_id IN ({post_placeholders})
+                """, affected_post_ids)
+            
             conn.commit()
             
             return {
@@ -1795,7 +1795,6 @@ async def show_post_for_commenting(update: Update, context: ContextTypes.DEFAULT
     
     content = post[1]
     category = post[2]
-    comment_count = get_comment_count(post_id)
     
     context.user_data['comment_post_id'] = post_id
     context.user_data['state'] = 'writing_comment'
@@ -1835,7 +1834,7 @@ async def show_comments_directly(update: Update, context: ContextTypes.DEFAULT_T
     try:
         logger.info(f"show_comments_directly called with post_id: {post_id}")
         post = get_post_by_id(post_id)
-        logger.info(f"Retrieved post: {post}")
+        logger.info(f"Retrieved post: {tuple(post) if post else post}")
         
         if not post or post[5] != 1:  # Check if approved (approved field is at index 5, value 1 = approved)
             await update.message.reply_text("❗ Post not found or not available.")
@@ -1853,7 +1852,7 @@ async def show_comments_directly(update: Update, context: ContextTypes.DEFAULT_T
     # Show comments starting from page 1
     try:
         logger.info(f"Getting paginated comments for post_id: {post_id}")
-        comments_data, current_page, total_pages, total_comments = get_comments_paginated(post_id, 1)
+        comments_data, current_page, total_pages, total_comments = await get_comments_paginated_async(post_id, 1)
         logger.info(f"Retrieved comments: data={len(comments_data) if comments_data else 0}, current_page={current_page}, total_pages={total_pages}, total_comments={total_comments}")
     except Exception as e:
         logger.error(f"Error getting paginated comments: {e}")
@@ -1888,7 +1887,7 @@ async def show_comments_directly(update: Update, context: ContextTypes.DEFAULT_T
     import asyncio
     
     # Send each comment as a separate message with delay (same as see_comments_callback)
-    for comment_index, comment_data in enumerate(comments_data):
+    for comment_data in comments_data:
         comment_id = comment_data['comment_id']
         content = comment_data['content']
         timestamp = comment_data['timestamp']
@@ -1896,11 +1895,11 @@ async def show_comments_directly(update: Update, context: ContextTypes.DEFAULT_T
         dislikes = comment_data['dislikes']
         is_reply = comment_data['is_reply']
         parent_comment_id = comment_data['parent_comment_id']
-        # Calculate sequential comment number based on page and position
-        sequential_comment_number = (current_page - 1) * COMMENTS_PER_PAGE + comment_index + 1
+        # Sequential number comes from the pagination query's ROW_NUMBER()
+        sequential_comment_number = comment_data['comment_number']
         
         # Get user reaction to current comment
-        user_reaction = get_user_reaction(user_id, comment_id)
+        user_reaction = await get_user_reaction_async(user_id, comment_id)
         like_emoji = "👍✅" if user_reaction == "like" else "👍"
         dislike_emoji = "👎✅" if user_reaction == "dislike" else "👎"
         
@@ -1918,9 +1917,6 @@ async def show_comments_directly(update: Update, context: ContextTypes.DEFAULT_T
                 original_preview = original_content[:150] + "..."
             else:
                 original_preview = original_content
-                
-            # Get original comment sequential number
-            original_seq_num = get_comment_sequential_number(original['comment_id'])
             
             # Use format_reply for consistent HTML blockquote styling
             from comments import format_reply
@@ -1970,12 +1966,12 @@ async def show_comments_directly(update: Update, context: ContextTypes.DEFAULT_T
                 sequential_reply_number = reply_index + 1
                 
                 # Get user reaction to this reply
-                reply_user_reaction = get_user_reaction(user_id, reply_id)
+                reply_user_reaction = await get_user_reaction_async(user_id, reply_id)
                 reply_like_emoji = "👍✅" if reply_user_reaction == "like" else "👍"
                 reply_dislike_emoji = "👎✅" if reply_user_reaction == "dislike" else "👎"
                 
                 # Get parent comment for quoted display
-                parent_comment_info = get_parent_comment_for_reply(reply_id)
+                parent_comment_info = await get_parent_comment_for_reply_async(reply_id)
                 
                 # Format the reply text with quoted original comment
                 formatted_reply_date = format_date_only(reply_timestamp)  # Get properly escaped date part
@@ -2042,12 +2038,12 @@ async def show_comments_directly(update: Update, context: ContextTypes.DEFAULT_T
                         sequential_sub_reply_number = sub_reply_index + 1
                         
                         # Get user reaction to this sub-reply
-                        sub_reply_user_reaction = get_user_reaction(user_id, sub_reply_id)
+                        sub_reply_user_reaction = await get_user_reaction_async(user_id, sub_reply_id)
                         sub_reply_like_emoji = "👍✅" if sub_reply_user_reaction == "like" else "👍"
                         sub_reply_dislike_emoji = "👎✅" if sub_reply_user_reaction == "dislike" else "👎"
                         
                         # Get parent reply for quoted display
-                        parent_reply_info = get_parent_comment_for_reply(sub_reply_id)
+                        parent_reply_info = await get_parent_comment_for_reply_async(sub_reply_id)
                         
                         # Format the sub-reply text with quoted original reply
                         formatted_sub_reply_date = format_date_only(sub_reply_timestamp)  # Get properly escaped date part
@@ -2143,7 +2139,7 @@ async def show_post_with_options(update: Update, context: ContextTypes.DEFAULT_T
     
     content = post[1]
     category = post[2]
-    comment_count = get_comment_count(post_id)
+    comment_count = post['comment_count']
     
     context.user_data['viewing_post_id'] = post_id
     
@@ -2202,7 +2198,7 @@ async def see_comments_callback(update: Update, context: ContextTypes.DEFAULT_TY
         context.user_data['current_page'] = page
         
         logger.info(f"Getting paginated comments for post_id: {post_id}, page: {page}")
-        comments_data, current_page, total_pages, total_comments = get_comments_paginated(post_id, page)
+        comments_data, current_page, total_pages, total_comments = await get_comments_paginated_async(post_id, page)
         logger.info(f"Retrieved comments: data={len(comments_data) if comments_data else 0}, current_page={current_page}, total_pages={total_pages}, total_comments={total_comments}")
     except Exception as e:
         logger.error(f"Error in see_comments_callback: {e}")
@@ -2246,7 +2242,7 @@ async def see_comments_callback(update: Update, context: ContextTypes.DEFAULT_TY
     import asyncio
     
     # Send each comment as a separate message with delay
-    for comment_index, comment_data in enumerate(comments_data):
+    for comment_data in comments_data:
         comment_id = comment_data['comment_id']
         content = comment_data['content']
         timestamp = comment_data['timestamp']
@@ -2254,11 +2250,11 @@ async def see_comments_callback(update: Update, context: ContextTypes.DEFAULT_TY
         dislikes = comment_data['dislikes']
         is_reply = comment_data['is_reply']
         parent_comment_id = comment_data['parent_comment_id']
-        # Calculate sequential comment number based on page and position
-        sequential_comment_number = (current_page - 1) * COMMENTS_PER_PAGE + comment_index + 1
+        # Sequential number comes from the pagination query's ROW_NUMBER()
+        sequential_comment_number = comment_data['comment_number']
         
         # Get user reaction to current comment
-        user_reaction = get_user_reaction(user_id, comment_id)
+        user_reaction = await get_user_reaction_async(user_id, comment_id)
         like_emoji = "👍✅" if user_reaction == "like" else "👍"
         dislike_emoji = "👎✅" if user_reaction == "dislike" else "👎"
         
@@ -2276,9 +2272,6 @@ async def see_comments_callback(update: Update, context: ContextTypes.DEFAULT_TY
                 original_preview = original_content[:150] + "..."
             else:
                 original_preview = original_content
-                
-            # Get original comment sequential number
-            original_seq_num = get_comment_sequential_number(original['comment_id'])
             
             # Use format_reply for consistent HTML blockquote styling
             from comments import format_reply
@@ -2389,8 +2382,8 @@ async def handle_comment_submission(update: Update, context: ContextTypes.DEFAUL
     # If this is a reply, format it with the parent comment
     if reply_to_comment_id:
         try:
-            from comments import get_parent_comment_for_reply, format_reply
-            parent_info = get_parent_comment_for_reply(reply_to_comment_id)
+            from comments import format_reply
+            parent_info = await get_parent_comment_for_reply_async(reply_to_comment_id)
             if parent_info:
                 parent_text = parent_info['content']
                 # Create formatted reply for notifications
@@ -2399,22 +2392,17 @@ async def handle_comment_submission(update: Update, context: ContextTypes.DEFAUL
             logger.error(f"Error formatting reply: {e}")
             # Continue with unformatted content if formatting fails
     
-    comment_id, error = save_comment(post_id, content, user_id, reply_to_comment_id)
+    comment_id, error = await save_comment_async(post_id, content, user_id, reply_to_comment_id)
     
     if error:
         await update.message.reply_text(f"❗ Error saving comment: {error}")
         return
     
-    # Update the comment count on the channel message
+    # Update the comment count on the channel message (debounced per post)
     try:
-        from comments import update_channel_message_comment_count
-        success, result = await update_channel_message_comment_count(context, post_id)
-        if success:
-            logger.info(f"Updated channel message comment count for post {post_id}: {result}")
-        else:
-            logger.warning(f"Failed to update channel message for post {post_id}: {result}")
+        schedule_channel_update(context, post_id)
     except Exception as e:
-        logger.error(f"Error updating channel message for post {post_id}: {e}")
+        logger.error(f"Error scheduling channel message update for post {post_id}: {e}")
     
     # Send notification to the original poster that their confession got a comment
     try:
@@ -2436,10 +2424,10 @@ async def handle_comment_submission(update: Update, context: ContextTypes.DEFAUL
     # Message for normal comment vs. reply with formatted content
     if reply_to_comment_id:
         # Fetch parent comment so we can show it inside the blockquote
-        parent_comment = get_comment_by_id(reply_to_comment_id)
+        parent_comment = await get_comment_by_id_async(reply_to_comment_id)
         
         if parent_comment:
-            formatted_text = format_reply(parent_comment[3], content)  # parent[3] = content
+            formatted_text = format_reply(parent_comment.content, content)
         else:
             formatted_text = content  # fallback if parent not found
 
@@ -3085,29 +3073,30 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Like comment
     if data.startswith("like_comment_"):
         comment_id = int(data.replace("like_comment_", ""))
-        success, action, likes, dislikes = react_to_comment(user_id, comment_id, "like")
+        success, action, likes, dislikes = await react_to_comment_async(user_id, comment_id, "like")
         
         if success:
             # Update the current message with new reaction counts
-            comment = get_comment_by_id(comment_id)
+            comment = await get_comment_by_id_async(comment_id)
             if comment:
                 # Get updated reaction info
-                user_reaction = get_user_reaction(user_id, comment_id)
+                user_reaction = await get_user_reaction_async(user_id, comment_id)
                 like_emoji = "👍✅" if user_reaction == "like" else "👍"
                 dislike_emoji = "👎✅" if user_reaction == "dislike" else "👎"
                 
                 # Get sequential number for display
-                sequential_number = get_comment_sequential_number(comment_id)
+                sequential_number = await get_comment_sequential_number_async(comment_id)
+                number_label = f"\\# {sequential_number}" if sequential_number is not None else ""
                 
                 # Check if this is a reply or main comment
-                formatted_date = format_date_only(comment[5])  # Get properly escaped date part
-                if comment[4]:  # parent_comment_id exists, so it's a reply
-                    comment_text = f"reply\\# {sequential_number}\n\n{escape_markdown_text(comment[3])}\n\n{formatted_date}"
+                formatted_date = format_date_only(comment.timestamp)  # Get properly escaped date part
+                if comment.parent_comment_id:  # it's a reply
+                    comment_text = f"reply{number_label}\n\n{escape_markdown_text(comment.content)}\n\n{formatted_date}"
                 else:
-                    comment_text = f"comment\\# {sequential_number}\n\n{escape_markdown_text(comment[3])}\n\n{formatted_date}"
+                    comment_text = f"comment{number_label}\n\n{escape_markdown_text(comment.content)}\n\n{formatted_date}"
                 
                 # Create updated keyboard
-                if comment[4]:  # Reply
+                if comment.parent_comment_id:  # Reply
                     updated_keyboard = [
                         [
                             InlineKeyboardButton(f"{like_emoji} {likes}", callback_data=f"like_comment_{comment_id}"),
@@ -3150,29 +3139,30 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Dislike comment
     if data.startswith("dislike_comment_"):
         comment_id = int(data.replace("dislike_comment_", ""))
-        success, action, likes, dislikes = react_to_comment(user_id, comment_id, "dislike")
+        success, action, likes, dislikes = await react_to_comment_async(user_id, comment_id, "dislike")
         
         if success:
             # Update the current message with new reaction counts
-            comment = get_comment_by_id(comment_id)
+            comment = await get_comment_by_id_async(comment_id)
             if comment:
                 # Get updated reaction info
-                user_reaction = get_user_reaction(user_id, comment_id)
+                user_reaction = await get_user_reaction_async(user_id, comment_id)
                 like_emoji = "👍✅" if user_reaction == "like" else "👍"
                 dislike_emoji = "👎✅" if user_reaction == "dislike" else "👎"
                 
                 # Get sequential number for display
-                sequential_number = get_comment_sequential_number(comment_id)
+                sequential_number = await get_comment_sequential_number_async(comment_id)
+                number_label = f"\\# {sequential_number}" if sequential_number is not None else ""
                 
                 # Check if this is a reply or main comment
-                formatted_date = format_date_only(comment[5])  # Get properly escaped date part
-                if comment[4]:  # parent_comment_id exists, so it's a reply
-                    comment_text = f"reply\\# {sequential_number}\n\n{escape_markdown_text(comment[3])}\n\n{formatted_date}"
+                formatted_date = format_date_only(comment.timestamp)  # Get properly escaped date part
+                if comment.parent_comment_id:  # it's a reply
+                    comment_text = f"reply{number_label}\n\n{escape_markdown_text(comment.content)}\n\n{formatted_date}"
                 else:
-                    comment_text = f"comment\\# {sequential_number}\n\n{escape_markdown_text(comment[3])}\n\n{formatted_date}"
+                    comment_text = f"comment{number_label}\n\n{escape_markdown_text(comment.content)}\n\n{formatted_date}"
                 
                 # Create updated keyboard
-                if comment[4]:  # Reply
+                if comment.parent_comment_id:  # Reply
                     updated_keyboard = [
                         [
                             InlineKeyboardButton(f"{like_emoji} {likes}", callback_data=f"like_comment_{comment_id}"),
@@ -3213,25 +3203,26 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Reply to comment
     if data.startswith("reply_comment_"):
         comment_id = int(data.replace("reply_comment_", ""))
-        comment = get_comment_by_id(comment_id)
+        comment = await get_comment_by_id_async(comment_id)
         
         if comment:
-            post_id = comment[1]
+            post_id = comment.post_id
             context.user_data['comment_post_id'] = post_id
             context.user_data['reply_to_comment_id'] = comment_id
             context.user_data['state'] = 'writing_comment'
             
-            comment_preview = truncate_text(comment[3], 100)
+            comment_preview = truncate_text(comment.content, 100)
             
             # Get sequential number for display
-            sequential_number = get_comment_sequential_number(comment_id)
+            sequential_number = await get_comment_sequential_number_async(comment_id)
+            number_label = f" \\#{sequential_number}" if sequential_number is not None else ""
             
             # Create cancel button for the reply interface
             reply_cancel_keyboard = [[InlineKeyboardButton("🚫 Cancel", callback_data="cancel_to_menu")]]
             reply_cancel_markup = InlineKeyboardMarkup(reply_cancel_keyboard)
             
             await query.edit_message_text(
-                f"💬 *Replying to comment \\#{sequential_number}*\n\n"
+                f"💬 *Replying to comment{number_label}*\n\n"
                 f"*Original:* {escape_markdown_text(comment_preview)}\n\n"
                 f"Write your reply \\(max {MAX_COMMENT_LENGTH} characters\\)\\:\n\n"
                 f"Type your reply below or use the Cancel button to return to main menu\\.",
@@ -3318,7 +3309,7 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         
         # Find which page the target comment is on
         from comments import find_comment_page
-        navigation_info = find_comment_page(target_comment_id)
+        navigation_info = await find_comment_page_async(target_comment_id)
         
         if not navigation_info:
             await query.answer("❗ Comment not found or no longer available!")
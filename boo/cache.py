@@ -0,0 +1,185 @@
+"""
+Short-lived JSON cache for hot per-user reads
+Backed by Redis when available, with an in-process fallback
+"""
+
+import json
+import time
+import functools
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+from config import REDIS_URL
+from logger import get_logger
+
+logger = get_logger('cache')
+
+# Same namespace as performance.CacheManager, so keys stay apart on a shared Redis
+KEY_PREFIX = "confession_bot:"
+
+
+class InMemoryCache:
+    """In-memory TTL cache as fallback"""
+
+    def __init__(self):
+        self.entries: Dict[str, Tuple[float, str]] = {}
+        self.lock = threading.Lock()
+        self.last_cleanup = time.time()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a raw value, or None if missing or expired"""
+        now = time.time()
+        with self.lock:
+            # Drop expired entries periodically
+            if now - self.last_cleanup > 60:
+                self._cleanup_expired(now)
+                self.last_cleanup = now
+
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self.entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: int):
+        """Store a raw value for ttl seconds"""
+        with self.lock:
+            self.entries[key] = (time.time() + ttl, value)
+
+    def delete(self, *keys: str):
+        """Remove keys if present"""
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def _cleanup_expired(self, now: float):
+        """Remove expired entries (caller holds the lock)"""
+        for key in [key for key, (expires_at, _) in self.entries.items() if expires_at <= now]:
+            del self.entries[key]
+
+
+class Cache:
+    """Main cache with Redis and in-memory fallback"""
+
+    def __init__(self):
+        self.redis_client = None
+        self.memory = InMemoryCache()
+
+        if not REDIS_AVAILABLE or redis is None:
+            logger.info("Redis module not available, using in-memory cache")
+            return
+
+        try:
+            client = redis.from_url(
+                REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5
+            )
+            # Test connection
+            client.ping()
+            self.redis_client = client
+            logger.info("Redis cache initialized successfully")
+        except Exception as e:
+            logger.warning(f"Redis not available, using in-memory cache: {e}")
+
+    @staticmethod
+    def _key(key: str) -> str:
+        """Namespace a key"""
+        return f"{KEY_PREFIX}{key}"
+
+    def get_json(self, key: str) -> Optional[Any]:
+        """Get a cached JSON value, or None on a miss"""
+        try:
+            if self.redis_client:
+                raw = self.redis_client.get(self._key(key))
+            else:
+                raw = self.memory.get(self._key(key))
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.error(f"Cache read error for {key}: {e}")
+            return None
+
+    def set_json(self, key: str, value: Any, ttl: int):
+        """Cache a JSON-serializable value for ttl seconds"""
+        try:
+            raw = json.dumps(value)
+            if self.redis_client:
+                self.redis_client.set(self._key(key), raw, ex=ttl)
+            else:
+                self.memory.set(self._key(key), raw, ttl)
+        except Exception as e:
+            logger.error(f"Cache write error for {key}: {e}")
+
+    def delete(self, *keys: str):
+        """Invalidate keys"""
+        if not keys:
+            return
+        keys = [self._key(key) for key in keys]
+        try:
+            if self.redis_client:
+                self.redis_client.delete(*keys)
+            else:
+                self.memory.delete(*keys)
+        except Exception as e:
+            logger.error(f"Cache delete error for {keys}: {e}")
+
+
+# Global cache instance
+cache = Cache()
+
+
+def get_json(key: str) -> Optional[Any]:
+    """Get a cached JSON value using the global cache"""
+    return cache.get_json(key)
+
+
+def set_json(key: str, value: Any, ttl: int):
+    """Cache a JSON value using the global cache"""
+    cache.set_json(key, value, ttl)
+
+
+def delete(*keys: str):
+    """Invalidate keys in the global cache"""
+    cache.delete(*keys)
+
+
+def cached(key_fn: Callable[..., str], ttl: int,
+           encode: Optional[Callable[[Any], Any]] = None,
+           decode: Optional[Callable[[Any], Any]] = None):
+    """Cache-aside decorator over the global cache
+
+    key_fn gets the call's arguments and returns the cache key, or None to
+    bypass the cache for that call. encode and decode convert results that
+    are not plain JSON (e.g. dataclasses).
+    None results are not cached, and cache errors fall through to the
+    wrapped function.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_fn(*args, **kwargs)
+            if key is None:
+                return fn(*args, **kwargs)
+
+            value = cache.get_json(key)
+            if value is not None:
+                return decode(value) if decode else value
+
+            value = fn(*args, **kwargs)
+            if value is not None:
+                cache.set_json(key, encode(value) if encode else value, ttl)
+            return value
+        return wrapper
+    return decorator
@@ -1,13 +1,172 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from config import COMMENTS_PER_PAGE, CHANNEL_ID, BOT_USERNAME
 from utils import escape_markdown_text
-from db import get_comment_count
-from db_connection import get_db_connection, execute_query, adapt_query
+from db_connection import get_db_connection, execute_query, execute_many, adapt_query, register_statement, INTEGRITY_ERRORS
 from submission import is_media_post, get_media_info
+from cachetools import TTLCache
+from dataclasses import dataclass
+from typing import Optional
+from functools import lru_cache
+import asyncio
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Short-lived point-read cache keyed by comment id. Writes made through this
+# module evict their keys; the TTL bounds staleness for writes made elsewhere.
+# The *_async variants run these functions on worker threads, so cache
+# access goes through a lock.
+_COMMENT_CACHE = TTLCache(maxsize=16384, ttl=10)
+_CACHE_LOCK = threading.Lock()
+
+# Hot queries, prepared once per pooled connection on PostgreSQL.
+# Replies carry their parent's snippet and timestamp on their own row; the
+# total count rides along as a window column.
+_Q_COMMENTS_PAGE = register_statement("comments_page", """
+    SELECT comment_id, content, timestamp, likes, dislikes, flagged, parent_comment_id,
+           ROW_NUMBER() OVER (ORDER BY timestamp ASC, comment_id ASC) as comment_number,
+           parent_content_snippet, parent_timestamp,
+           COUNT(*) OVER () as total_count
+    FROM comments
+    WHERE post_id = ?
+    ORDER BY timestamp ASC, comment_id ASC
+    LIMIT ? OFFSET ?
+""")
+_Q_COMMENT_BY_ID = register_statement("comment_by_id", """
+    SELECT comment_id, post_id, user_id, content, parent_comment_id,
+           timestamp, likes, dislikes, flagged
+    FROM comments WHERE comment_id = ?
+""")
+_Q_POST_CHANNEL_INFO = register_statement(
+    "post_channel_info",
+    "SELECT post_id, content, category, channel_message_id, approved FROM posts WHERE post_id = ?"
+)
+_Q_USER_REACTION = register_statement(
+    "user_comment_reaction",
+    "SELECT reaction_type FROM reactions WHERE user_id = ? AND target_type = 'comment' AND target_id = ?"
+)
+_Q_APPLY_REACTION_COUNTS = register_statement("apply_comment_reaction_counts", """
+    UPDATE comments SET likes = likes + ?, dislikes = dislikes + ?
+    WHERE comment_id = ?
+    RETURNING likes, dislikes
+""")
+# Position of a comment in the ordering get_comments_paginated pages over
+_Q_COMMENT_POSITION = register_statement("comment_position", """
+    WITH ranked AS (
+        SELECT comment_id, post_id,
+               ROW_NUMBER() OVER (ORDER BY timestamp ASC, comment_id ASC) AS rn
+        FROM comments
+        WHERE post_id = (SELECT post_id FROM comments WHERE comment_id = ?)
+    )
+    SELECT post_id, rn - 1 AS comments_before FROM ranked WHERE comment_id = ?
+""")
+# Sequential numbers share the pagination ordering: timestamp, then
+# comment_id so comments posted in the same second never share a number
+_Q_COMMENT_SEQUENCE = register_statement("comment_sequence", """
+    WITH ranked AS (
+        SELECT comment_id,
+               ROW_NUMBER() OVER (ORDER BY timestamp ASC, comment_id ASC) AS rn
+        FROM comments
+        WHERE post_id = (SELECT post_id FROM comments WHERE comment_id = ?)
+    )
+    SELECT rn AS sequential_number FROM ranked WHERE comment_id = ?
+""")
+_Q_REPLY_PARENT = register_statement("reply_parent", """
+    WITH parent AS (
+        SELECT p.comment_id, p.post_id, p.content, p.timestamp
+        FROM comments c
+        JOIN comments p ON p.comment_id = c.parent_comment_id
+        WHERE c.comment_id = ?
+    ), ranked AS (
+        SELECT comment_id,
+               ROW_NUMBER() OVER (ORDER BY timestamp ASC, comment_id ASC) AS rn
+        FROM comments
+        WHERE post_id = (SELECT post_id FROM parent)
+    )
+    SELECT parent.comment_id, parent.post_id, parent.content, parent.timestamp,
+           ranked.rn AS sequential_number
+    FROM parent
+    JOIN ranked ON ranked.comment_id = parent.comment_id
+""")
+
+# Remaining queries, translated for the active backend once at import.
+# New comments copy their parent's content (cut to the 150 characters a
+# reply quote shows) and timestamp, taking the parent id as the last two
+# parameters; both stay NULL for top-level comments.
+_PARENT_COPY_COLUMNS = """
+    (SELECT CASE WHEN length(content) > 150 THEN substr(content, 1, 150) || '...' ELSE content END
+     FROM comments WHERE comment_id = ?),
+    (SELECT timestamp FROM comments WHERE comment_id = ?)
+"""
+_Q_SAVE_COMMENT = adapt_query(f"""
+    INSERT INTO comments (post_id, content, user_id, parent_comment_id, parent_content_snippet, parent_timestamp)
+    SELECT ?, ?, ?, ?, {_PARENT_COPY_COLUMNS}
+    WHERE EXISTS (SELECT 1 FROM posts WHERE post_id = ? AND approved = 1)
+""")
+# PostgreSQL folds the counter updates into the same statement
+_Q_SAVE_COMMENT_PG = adapt_query(f"""
+    WITH ins AS (
+        INSERT INTO comments (post_id, content, user_id, parent_comment_id, parent_content_snippet, parent_timestamp)
+        SELECT ?, ?, ?, ?, {_PARENT_COPY_COLUMNS}
+        WHERE EXISTS (SELECT 1 FROM posts WHERE post_id = ? AND approved = 1)
+        RETURNING comment_id
+    ), upd AS (
+        UPDATE users SET comments_posted = comments_posted + 1
+        WHERE user_id = ? AND EXISTS (SELECT 1 FROM ins)
+    ), cnt AS (
+        UPDATE posts SET comment_count = comment_count + 1
+        WHERE post_id = ? AND EXISTS (SELECT 1 FROM ins)
+    )
+    SELECT comment_id FROM ins
+""")
+_Q_INSERT_COMMENT = adapt_query(f"""
+    INSERT INTO comments (post_id, content, user_id, parent_comment_id, parent_content_snippet, parent_timestamp)
+    SELECT ?, ?, ?, ?, {_PARENT_COPY_COLUMNS}
+""")
+_Q_ADD_USER_COMMENTS = adapt_query("UPDATE users SET comments_posted = comments_posted + ? WHERE user_id = ?")
+_Q_ADD_POST_COMMENTS = adapt_query("UPDATE posts SET comment_count = comment_count + ? WHERE post_id = ?")
+_Q_POST_COMMENT_TOTAL = adapt_query("SELECT COUNT(*) AS total FROM comments WHERE post_id = ?")
+_Q_FLAG_COMMENT = adapt_query("UPDATE comments SET flagged = 1 WHERE comment_id = ?")
+_Q_COMMENT_THREAD_INFO = adapt_query("SELECT post_id, parent_comment_id FROM comments WHERE comment_id = ?")
+_Q_CHANNEL_POST = adapt_query("SELECT post_id, content, category, channel_message_id, approved, post_number, comment_count FROM posts WHERE post_id = ?")
+_Q_CHANNEL_POSTS_IN = adapt_query("SELECT post_id, content, category, channel_message_id, approved, post_number, comment_count FROM posts WHERE post_id IN ({placeholders})")
+
+@dataclass
+class CommentRow:
+    """A single comment as returned by get_comment_by_id"""
+    comment_id: int
+    post_id: int
+    user_id: int
+    content: str
+    parent_comment_id: Optional[int]
+    timestamp: str
+    likes: int
+    dislikes: int
+    flagged: int
+
+
+# Debounced channel-message edits: post_id -> pending timer. Posts whose timer
+# has fired wait in _due_channel_updates until one flush task edits them all.
+_pending_updates: dict[int, asyncio.TimerHandle] = {}
+_due_channel_updates: set[int] = set()
+_flush_task = None
+
+
+def _cache_get(cache, key):
+    with _CACHE_LOCK:
+        return cache.get(key)
+
+
+def _cache_set(cache, key, value):
+    with _CACHE_LOCK:
+        cache[key] = value
+
+
+def _cache_pop(cache, key):
+    with _CACHE_LOCK:
+        cache.pop(key, None)
+
 
 def save_comment(post_id, content, user_id, parent_comment_id=None):
     """Save a comment to the database"""
@@ -16,43 +175,42 @@ def save_comment(post_id, content, user_id, parent_comment_id=None):
         with db_conn.get_connection() as conn:
             cursor = conn.cursor()
             
-            # First, validate that the post exists
-            post_check_query = adapt_query("SELECT post_id FROM posts WHERE post_id = ? AND approved = 1")
-            cursor.execute(post_check_query, (post_id,))
-            post_exists = cursor.fetchone()
+            # The approved-post check rides on the INSERT itself and the
+            # parent is enforced by the foreign key, so the happy path is a
+            # single statement instead of two lookups plus the insert.
+            try:
+                insert_params = (post_id, content, user_id, parent_comment_id,
+                                 parent_comment_id, parent_comment_id, post_id)
+                if db_conn.use_postgresql:
+                    # PostgreSQL: fold the counter updates into the same statement
+                    cursor.execute(_Q_SAVE_COMMENT_PG, insert_params + (user_id, post_id))
+                    row = cursor.fetchone()
+                    comment_id = row[0] if row else None
+                else:
+                    # SQLite: no DML in CTEs, so the counter updates follow in-process
+                    cursor.execute(_Q_SAVE_COMMENT, insert_params)
+                    comment_id = cursor.lastrowid if cursor.rowcount == 1 else None
+                    
+                    if comment_id is not None:
+                        cursor.execute(_Q_ADD_USER_COMMENTS, (1, user_id))
+                        cursor.execute(_Q_ADD_POST_COMMENTS, (1, post_id))
+            except INTEGRITY_ERRORS as e:
+                conn.rollback()
+                # The violated key may be the parent or the user; only blame
+                # the parent when it really is missing
+                if parent_comment_id:
+                    cursor.execute(_Q_COMMENT_THREAD_INFO, (parent_comment_id,))
+                    if cursor.fetchone() is None:
+                        logger.error(f"Cannot save comment: Parent comment {parent_comment_id} does not exist")
+                        return None, f"Parent comment {parent_comment_id} not found"
+                logger.error(f"Cannot save comment: constraint violation ({e})")
+                return None, f"Database error: {str(e)}"
             
-            if not post_exists:
+            if comment_id is None:
                 logger.error(f"Cannot save comment: Post {post_id} does not exist or is not approved")
                 return None, f"Post {post_id} not found or not approved"
             
-            # Validate parent comment if provided
-            if parent_comment_id:
-                parent_check_query = adapt_query("SELECT comment_id FROM comments WHERE comment_id = ?")
-                cursor.execute(parent_check_query, (parent_comment_id,))
-                parent_exists = cursor.fetchone()
-                
-                if not parent_exists:
-                    logger.error(f"Cannot save comment: Parent comment {parent_comment_id} does not exist")
-                    return None, f"Parent comment {parent_comment_id} not found"
-            
-            # Insert comment using proper database abstraction
-            if db_conn.use_postgresql:
-                # PostgreSQL: use RETURNING clause to get the ID
-                insert_query = adapt_query("INSERT INTO comments (post_id, content, user_id, parent_comment_id) VALUES (?, ?, ?, ?) RETURNING comment_id")
-                cursor.execute(insert_query, (post_id, content, user_id, parent_comment_id))
-                comment_id = cursor.fetchone()[0]
-            else:
-                # SQLite: use lastrowid
-                insert_query = adapt_query("INSERT INTO comments (post_id, content, user_id, parent_comment_id) VALUES (?, ?, ?, ?)")
-                cursor.execute(insert_query, (post_id, content, user_id, parent_comment_id))
-                comment_id = cursor.lastrowid
-
-            # Update user stats
-            update_query = adapt_query("UPDATE users SET comments_posted = comments_posted + 1 WHERE user_id = ?")
-            cursor.execute(update_query, (user_id,))
-            
-            if db_conn.use_postgresql:
-                conn.commit()
+            conn.commit()
             
             return comment_id, None
     except Exception as e:
@@ -60,11 +218,49 @@ def save_comment(post_id, content, user_id, parent_comment_id=None):
         return None, f"Database error: {str(e)}"
 
 
+def save_comments_bulk(rows):
+    """
+    Save many comments in one transaction.
+
+    rows is an iterable of (post_id, content, user_id, parent_comment_id)
+    tuples. Existence of posts and parents is enforced by the foreign keys,
+    so a bad row aborts the whole batch. Returns (saved_count, error).
+    """
+    rows = [tuple(row) for row in rows]
+    if not rows:
+        return 0, None
+
+    comments_per_user = {}
+    comments_per_post = {}
+    for row in rows:
+        comments_per_user[row[2]] = comments_per_user.get(row[2], 0) + 1
+        comments_per_post[row[0]] = comments_per_post.get(row[0], 0) + 1
+
+    db_conn = get_db_connection()
+    try:
+        with db_conn.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                db_conn.execute_batch(cursor, _Q_INSERT_COMMENT, [row + (row[3], row[3]) for row in rows])
+                db_conn.execute_batch(cursor, _Q_ADD_USER_COMMENTS, [(count, user_id) for user_id, count in comments_per_user.items()])
+
+                db_conn.execute_batch(cursor, _Q_ADD_POST_COMMENTS, [(count, post_id) for post_id, count in comments_per_post.items()])
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            return len(rows), None
+    except Exception as e:
+        logger.error(f"Error saving comments in bulk: {e}")
+        return 0, f"Database error: {str(e)}"
+
+
 def get_post_with_channel_info(post_id):
     """Get post information including channel message ID"""
     try:
-        query = adapt_query("SELECT post_id, content, category, channel_message_id, approved FROM posts WHERE post_id = ?")
-        result = execute_query(query, (post_id,), fetch='one')
+        result = execute_query(_Q_POST_CHANNEL_INFO, (post_id,), fetch='one')
         return result
     except Exception as e:
         logger.error(f"Error getting post info: {e}")
@@ -76,69 +272,34 @@ def get_comments_paginated(post_id, page=1):
     offset = (page - 1) * COMMENTS_PER_PAGE
 
     try:
-        # Get total count using the existing function
-        total_comments = get_comment_count(post_id)
-
-        # Get paginated comments
-        db_conn = get_db_connection()
-        
-        if db_conn.use_postgresql:
-            # PostgreSQL version with ROW_NUMBER()
-            query = """
-                SELECT comment_id, content, timestamp, likes, dislikes, flagged, parent_comment_id,
-                       ROW_NUMBER() OVER (ORDER BY timestamp ASC) as comment_number
-                FROM comments 
-                WHERE post_id = %s
-                ORDER BY timestamp ASC
-                LIMIT %s OFFSET %s
-            """
+        # Get paginated comments; the total count rides along as a window column
+        comments = execute_query(_Q_COMMENTS_PAGE, (post_id, COMMENTS_PER_PAGE, offset), fetch='all')
+
+        if comments:
+            total_comments = comments[0]['total_count']
+        elif offset:
+            # Past the last page there are no rows to carry the count
+            result = execute_query(_Q_POST_COMMENT_TOTAL, (post_id,), fetch='one')
+            total_comments = result['total'] if result else 0
         else:
-            # SQLite version with ROW_NUMBER()
-            query = """
-                SELECT comment_id, content, timestamp, likes, dislikes, flagged, parent_comment_id,
-                       ROW_NUMBER() OVER (ORDER BY timestamp ASC) as comment_number
-                FROM comments 
-                WHERE post_id = ?
-                ORDER BY timestamp ASC
-                LIMIT ? OFFSET ?
-            """
-        
-        comments = execute_query(query, (post_id, COMMENTS_PER_PAGE, offset), fetch='all')
+            total_comments = 0
 
         # Transform into simplified flat structure
         comments_flat = []
-        for comment in comments or []:
-            comment_id = comment[0]
-            content = comment[1]
-            timestamp = comment[2]
-            likes = comment[3]
-            dislikes = comment[4]
-            flagged = comment[5]
-            parent_comment_id = comment[6]
-            comment_number = comment[7]
+        for row in comments or []:
+            comment_data = dict(row)
+            del comment_data['total_count']
+            parent_content = comment_data.pop('parent_content_snippet')
+            parent_timestamp = comment_data.pop('parent_timestamp')
+            comment_data['is_reply'] = row['parent_comment_id'] is not None
             
-            comment_data = {
-                'comment_id': comment_id,
-                'content': content,
-                'timestamp': timestamp,
-                'likes': likes,
-                'dislikes': dislikes,
-                'flagged': flagged,
-                'parent_comment_id': parent_comment_id,
-                'comment_number': comment_number,
-                'is_reply': parent_comment_id is not None
-            }
-            
-            # If this is a reply, get the original comment info
-            if parent_comment_id:
-                original_query = adapt_query("SELECT comment_id, content, timestamp FROM comments WHERE comment_id = ?")
-                original = execute_query(original_query, (parent_comment_id,), fetch='one')
-                if original:
-                    comment_data['original_comment'] = {
-                        'comment_id': original[0],
-                        'content': original[1],
-                        'timestamp': original[2]
-                    }
+            # If this is a reply, attach the original comment copied onto the row
+            if row['parent_comment_id'] and parent_content is not None:
+                comment_data['original_comment'] = {
+                    'comment_id': row['parent_comment_id'],
+                    'content': parent_content,
+                    'timestamp': parent_timestamp
+                }
             
             comments_flat.append(comment_data)
 
@@ -152,9 +313,16 @@ def get_comments_paginated(post_id, page=1):
 
 def get_comment_by_id(comment_id):
     """Get a specific comment by ID"""
+    cached = _cache_get(_COMMENT_CACHE, comment_id)
+    if cached is not None:
+        return cached
     try:
-        query = adapt_query("SELECT * FROM comments WHERE comment_id = ?")
-        return execute_query(query, (comment_id,), fetch='one')
+        row = execute_query(_Q_COMMENT_BY_ID, (comment_id,), fetch='one')
+        if row is None:
+            return None
+        result = CommentRow(**dict(row))
+        _cache_set(_COMMENT_CACHE, comment_id, result)
+        return result
     except Exception as e:
         logger.error(f"Error getting comment by ID: {e}")
         return None
@@ -167,56 +335,71 @@ def react_to_comment(user_id, comment_id, reaction_type):
         with db_conn.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Check existing reaction
-            check_query = adapt_query("SELECT reaction_type FROM reactions WHERE user_id = ? AND target_type = 'comment' AND target_id = ?")
-            cursor.execute(check_query, (user_id, comment_id))
-            existing = cursor.fetchone()
+            if db_conn.use_postgresql:
+                # Read the previous reaction and toggle/upsert it in a single statement
+                cursor.execute("""
+                    WITH prev AS (
+                        SELECT reaction_type FROM reactions
+                        WHERE user_id = %(user_id)s AND target_type = 'comment' AND target_id = %(comment_id)s
+                    ),
+                    removed AS (
+                        DELETE FROM reactions
+                        WHERE user_id = %(user_id)s AND target_type = 'comment' AND target_id = %(comment_id)s
+                          AND reaction_type = %(reaction_type)s
+                        RETURNING reaction_type
+                    ),
+                    upserted AS (
+                        INSERT INTO reactions (user_id, target_type, target_id, reaction_type)
+                        SELECT %(user_id)s, 'comment', %(comment_id)s, %(reaction_type)s
+                        WHERE NOT EXISTS (SELECT 1 FROM prev WHERE reaction_type = %(reaction_type)s)
+                        ON CONFLICT (user_id, target_type, target_id)
+                        DO UPDATE SET reaction_type = EXCLUDED.reaction_type
+                        RETURNING reaction_type
+                    )
+                    SELECT (SELECT reaction_type FROM prev), (SELECT reaction_type FROM upserted)
+                """, {'user_id': user_id, 'comment_id': comment_id, 'reaction_type': reaction_type})
+                previous, current = cursor.fetchone()
+            else:
+                # SQLite has no data-modifying CTEs; these statements stay in-process
+                cursor.execute(
+                    "SELECT reaction_type FROM reactions WHERE user_id = ? AND target_type = 'comment' AND target_id = ?",
+                    (user_id, comment_id)
+                )
+                existing = cursor.fetchone()
+                previous = existing[0] if existing else None
 
-            if existing:
-                if existing[0] == reaction_type:
+                if previous == reaction_type:
                     # Remove reaction if same type
-                    delete_query = adapt_query("DELETE FROM reactions WHERE user_id = ? AND target_type = 'comment' AND target_id = ?")
-                    cursor.execute(delete_query, (user_id, comment_id))
-                    
-                    # Update comment counts
-                    if reaction_type == 'like':
-                        update_query = adapt_query("UPDATE comments SET likes = likes - 1 WHERE comment_id = ?")
-                    else:
-                        update_query = adapt_query("UPDATE comments SET dislikes = dislikes - 1 WHERE comment_id = ?")
-                    cursor.execute(update_query, (comment_id,))
-                    action = "removed"
-                else:
-                    # Update reaction type
-                    update_reaction_query = adapt_query("UPDATE reactions SET reaction_type = ? WHERE user_id = ? AND target_type = 'comment' AND target_id = ?")
-                    cursor.execute(update_reaction_query, (reaction_type, user_id, comment_id))
-                    
-                    # Update comment counts
-                    if existing[0] == 'like':
-                        update_query = adapt_query("UPDATE comments SET likes = likes - 1, dislikes = dislikes + 1 WHERE comment_id = ?")
-                    else:
-                        update_query = adapt_query("UPDATE comments SET likes = likes + 1, dislikes = dislikes - 1 WHERE comment_id = ?")
-                    cursor.execute(update_query, (comment_id,))
-                    action = "changed"
-            else:
-                # Add new reaction
-                insert_query = adapt_query("INSERT INTO reactions (user_id, target_type, target_id, reaction_type) VALUES (?, 'comment', ?, ?)")
-                cursor.execute(insert_query, (user_id, comment_id, reaction_type))
-                
-                # Update comment counts
-                if reaction_type == 'like':
-                    update_query = adapt_query("UPDATE comments SET likes = likes + 1 WHERE comment_id = ?")
+                    cursor.execute(
+                        "DELETE FROM reactions WHERE user_id = ? AND target_type = 'comment' AND target_id = ?",
+                        (user_id, comment_id)
+                    )
+                    current = None
                 else:
-                    update_query = adapt_query("UPDATE comments SET dislikes = dislikes + 1 WHERE comment_id = ?")
-                cursor.execute(update_query, (comment_id,))
+                    cursor.execute("""
+                        INSERT INTO reactions (user_id, target_type, target_id, reaction_type)
+                        VALUES (?, 'comment', ?, ?)
+                        ON CONFLICT (user_id, target_type, target_id)
+                        DO UPDATE SET reaction_type = excluded.reaction_type
+                    """, (user_id, comment_id, reaction_type))
+                    current = reaction_type
+
+            if previous is None:
                 action = "added"
+            elif current is None:
+                action = "removed"
+            else:
+                action = "changed"
 
-            if db_conn.use_postgresql:
-                conn.commit()
-
-            # Return current counts
-            count_query = adapt_query("SELECT likes, dislikes FROM comments WHERE comment_id = ?")
-            cursor.execute(count_query, (comment_id,))
+            # Apply the count deltas and read back the current counts
+            like_delta = (current == 'like') - (previous == 'like')
+            dislike_delta = (current == 'dislike') - (previous == 'dislike')
+            cursor.execute(_Q_APPLY_REACTION_COUNTS, (like_delta, dislike_delta, comment_id))
             counts = cursor.fetchone()
+
+            conn.commit()
+            _cache_pop(_COMMENT_CACHE, comment_id)
+
             current_likes = counts[0] if counts else 0
             current_dislikes = counts[1] if counts else 0
 
@@ -227,79 +410,57 @@ def react_to_comment(user_id, comment_id, reaction_type):
 
 
 def flag_comment(comment_id):
-    """Flag a comment for review"""
+    """Flag a comment for review (accepts a single id or an iterable of ids)"""
+    if not isinstance(comment_id, (int, str)):
+        return flag_comments_bulk(comment_id)
     try:
-        query = adapt_query("UPDATE comments SET flagged = 1 WHERE comment_id = ?")
-        execute_query(query, (comment_id,))
+        execute_query(_Q_FLAG_COMMENT, (comment_id,))
+        _cache_pop(_COMMENT_CACHE, comment_id)
         return True
     except Exception as e:
         logger.error(f"Error flagging comment: {e}")
         return False
 
 
+def flag_comments_bulk(comment_ids):
+    """Flag many comments for review in one batched write"""
+    try:
+        comment_ids = list(comment_ids)
+        execute_many(_Q_FLAG_COMMENT, [(comment_id,) for comment_id in comment_ids])
+        for comment_id in comment_ids:
+            _cache_pop(_COMMENT_CACHE, comment_id)
+        return True
+    except Exception as e:
+        logger.error(f"Error flagging comments: {e}")
+        return False
+
+
 def get_user_reaction(user_id, comment_id):
     """Get user's reaction to a specific comment"""
     try:
-        query = adapt_query("SELECT reaction_type FROM reactions WHERE user_id = ? AND target_type = 'comment' AND target_id = ?")
-        result = execute_query(query, (user_id, comment_id), fetch='one')
-        return result[0] if result else None
+        result = execute_query(_Q_USER_REACTION, (user_id, comment_id), fetch='one')
+        return result['reaction_type'] if result else None
     except Exception as e:
         logger.error(f"Error getting user reaction: {e}")
         return None
 
 
 def get_comment_sequential_number(comment_id):
-    """Get the sequential number of a comment within its post (flat structure)"""
+    """Get the sequential number of a comment within its post (flat structure), or None if unknown"""
     try:
-        # Get the comment's post_id and timestamp
-        info_query = adapt_query("SELECT post_id, timestamp FROM comments WHERE comment_id = ?")
-        comment_info = execute_query(info_query, (comment_id,), fetch='one')
-
-        if not comment_info:
-            return None
-
-        post_id, timestamp = comment_info
-
-        # Count all comments in this post that were posted before or at the same time
-        count_query = adapt_query("""
-            SELECT COUNT(*) FROM comments 
-            WHERE post_id = ? AND timestamp <= ?
-            ORDER BY timestamp ASC
-        """)
-        result = execute_query(count_query, (post_id, timestamp), fetch='one')
-        return result[0] if result else 1
+        result = execute_query(_Q_COMMENT_SEQUENCE, (comment_id, comment_id), fetch='one')
+        return result['sequential_number'] if result else None
     except Exception as e:
         logger.error(f"Error getting comment sequential number: {e}")
-        return 1
+        return None
 
 
 def get_parent_comment_for_reply(comment_id):
     """Get the original comment details for a reply (flat structure)"""
     try:
-        # Get parent comment ID
-        parent_query = adapt_query("SELECT parent_comment_id FROM comments WHERE comment_id = ?")
-        result = execute_query(parent_query, (comment_id,), fetch='one')
-
-        if not result or not result[0]:
-            return None
-
-        parent_comment_id = result[0]
-
-        # Get parent comment details
-        details_query = adapt_query("SELECT comment_id, post_id, content, timestamp FROM comments WHERE comment_id = ?")
-        parent_comment = execute_query(details_query, (parent_comment_id,), fetch='one')
-
-        if parent_comment:
-            parent_sequential_number = get_comment_sequential_number(parent_comment_id)
-            return {
-                'comment_id': parent_comment[0],
-                'post_id': parent_comment[1],
-                'content': parent_comment[2],
-                'timestamp': parent_comment[3],
-                'sequential_number': parent_sequential_number
-            }
-
-        return None
+        # Parent row and its sequential number in one round trip
+        parent_comment = execute_query(_Q_REPLY_PARENT, (comment_id,), fetch='one')
+        return dict(parent_comment) if parent_comment else None
     except Exception as e:
         logger.error(f"Error getting parent comment: {e}")
         return None
@@ -308,37 +469,68 @@ def get_parent_comment_for_reply(comment_id):
 def find_comment_page(comment_id):
     """Find which page a comment is on for navigation"""
     try:
-        # Get comment info
-        info_query = adapt_query("SELECT post_id, parent_comment_id FROM comments WHERE comment_id = ?")
-        comment_info = execute_query(info_query, (comment_id,), fetch='one')
+        # Comments are listed flat, replies included, so the comment itself
+        # is ranked among all of the post's comments
+        position = execute_query(_Q_COMMENT_POSITION, (comment_id, comment_id), fetch='one')
         
-        if not comment_info:
+        if not position:
             return None
-            
-        post_id, parent_comment_id = comment_info
-        
-        # If it's a reply, find the parent comment's page
-        target_comment_id = parent_comment_id if parent_comment_id else comment_id
         
-        # Count parent comments before this one
-        count_query = adapt_query("""
-            SELECT COUNT(*) FROM comments 
-            WHERE post_id = ? AND parent_comment_id IS NULL AND comment_id < ?
-            ORDER BY timestamp ASC
-        """)
-        comments_before = execute_query(count_query, (post_id, target_comment_id), fetch='one')[0]
-        page = (comments_before // COMMENTS_PER_PAGE) + 1
+        page = (position['comments_before'] // COMMENTS_PER_PAGE) + 1
         
         return {
             'page': page,
-            'post_id': post_id,
-            'comment_id': target_comment_id
+            'post_id': position['post_id'],
+            'comment_id': comment_id
         }
     except Exception as e:
         logger.error(f"Error finding comment page: {e}")
         return None
 
 
+# Async variants for use from Telegram handlers. The drivers are blocking, so
+# each call runs on the default executor instead of stalling the event loop.
+
+async def save_comment_async(post_id, content, user_id, parent_comment_id=None):
+    """Async variant of save_comment"""
+    return await asyncio.to_thread(save_comment, post_id, content, user_id, parent_comment_id)
+
+
+async def get_comments_paginated_async(post_id, page=1):
+    """Async variant of get_comments_paginated"""
+    return await asyncio.to_thread(get_comments_paginated, post_id, page)
+
+
+async def get_comment_by_id_async(comment_id):
+    """Async variant of get_comment_by_id"""
+    return await asyncio.to_thread(get_comment_by_id, comment_id)
+
+
+async def react_to_comment_async(user_id, comment_id, reaction_type):
+    """Async variant of react_to_comment"""
+    return await asyncio.to_thread(react_to_comment, user_id, comment_id, reaction_type)
+
+
+async def get_user_reaction_async(user_id, comment_id):
+    """Async variant of get_user_reaction"""
+    return await asyncio.to_thread(get_user_reaction, user_id, comment_id)
+
+
+async def get_comment_sequential_number_async(comment_id):
+    """Async variant of get_comment_sequential_number"""
+    return await asyncio.to_thread(get_comment_sequential_number, comment_id)
+
+
+async def get_parent_comment_for_reply_async(comment_id):
+    """Async variant of get_parent_comment_for_reply"""
+    return await asyncio.to_thread(get_parent_comment_for_reply, comment_id)
+
+
+async def find_comment_page_async(comment_id):
+    """Async variant of find_comment_page"""
+    return await asyncio.to_thread(find_comment_page, comment_id)
+
+
 # Format replies to look like Telegram's native reply feature
 def format_reply(parent_text, child_text, parent_author="Anonymous"):
     """Format reply messages to look like Telegram's native reply feature with blockquote"""
@@ -354,20 +546,84 @@ async def update_channel_message_comment_count(context, post_id):
     """Update the comment count on the channel message"""
     try:
         # Get post info using database abstraction
-        post_query = adapt_query("SELECT post_id, content, category, channel_message_id, approved, post_number FROM posts WHERE post_id = ?")
-        post_info = execute_query(post_query, (post_id,), fetch='one')
+        post_info = await asyncio.to_thread(execute_query, _Q_CHANNEL_POST, (post_id,), 'one')
+    except Exception as e:
+        logger.error(f"Error updating channel message: {e}")
+        return False, f"Failed to update channel message: {str(e)}"
+
+    return await _edit_channel_message(context, post_info)
+
+
+def schedule_channel_update(context, post_id, delay=3.0):
+    """
+    Debounce the channel message edit for a post.
+
+    Each call restarts the post's timer, so a burst of comments results in
+    a single edit once the post has been quiet for `delay` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    handle = _pending_updates.pop(post_id, None)
+    if handle is not None:
+        handle.cancel()
+    _pending_updates[post_id] = loop.call_later(delay, _channel_update_due, context, post_id)
+
+
+def _channel_update_due(context, post_id):
+    """Timer callback: queue the post and make sure a flush is scheduled"""
+    global _flush_task
+    _pending_updates.pop(post_id, None)
+    _due_channel_updates.add(post_id)
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.ensure_future(_flush_channel_updates(context))
+
+
+async def _flush_channel_updates(context):
+    """Edit the channel messages of every due post, fetching them in one query"""
+    while _due_channel_updates:
+        post_ids = list(_due_channel_updates)
+        _due_channel_updates.clear()
+
+        try:
+            placeholders = ','.join([get_db_connection().get_placeholder() for _ in post_ids])
+            posts_query = _Q_CHANNEL_POSTS_IN.format(placeholders=placeholders)
+            rows = await asyncio.to_thread(execute_query, posts_query, tuple(post_ids), 'all')
+        except Exception as e:
+            logger.error(f"Error fetching posts for channel update: {e}")
+            continue
+
+        for post_info in rows or []:
+            success, result = await _edit_channel_message(context, post_info)
+            if success:
+                logger.info(f"Updated channel message comment count for post {post_info['post_id']}: {result}")
+            else:
+                logger.warning(f"Failed to update channel message for post {post_info['post_id']}: {result}")
 
-        if not post_info or not post_info[3]:
+
+@lru_cache(maxsize=1024)
+def _format_categories(category):
+    """Render a post's comma-separated categories as hashtags"""
+    return " ".join(
+        [f"#{cat.strip().replace(' ', '')}" for cat in category.split(",")]
+    )
+
+
+async def _edit_channel_message(context, post_info):
+    """Re-render a post's channel message from its posts row"""
+    try:
+        if not post_info or not post_info['channel_message_id']:
             return False, "No channel message found"
 
-        post_id, content, category, channel_message_id, approved, post_number = post_info
+        post_id = post_info['post_id']
+        content = post_info['content']
+        category = post_info['category']
+        channel_message_id = post_info['channel_message_id']
+        approved = post_info['approved']
+        post_number = post_info['post_number']
+        comment_count = post_info['comment_count']
 
         if approved != 1:
             return False, "Post not approved"
 
-        # Use the properly working get_comment_count function
-        comment_count = get_comment_count(post_id)
-
         bot_username_clean = BOT_USERNAME.lstrip('@')
         keyboard = [
             [
@@ -385,12 +641,10 @@ async def update_channel_message_comment_count(context, post_id):
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
 
-        categories_text = " ".join(
-            [f"#{cat.strip().replace(' ', '')}" for cat in category.split(",")]
-        )
+        categories_text = _format_categories(category)
 
-        if is_media_post(post_id):
-            media_info = get_media_info(post_id)
+        if await asyncio.to_thread(is_media_post, post_id):
+            media_info = await asyncio.to_thread(get_media_info, post_id)
             if media_info:
                 caption_text = f"<b>Confess # {post_number}</b>"
 
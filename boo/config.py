@@ -73,6 +73,8 @@ PG_PORT = get_env_int("PGPORT", 5432, required=False)
 PG_DATABASE = get_env_var("PGDATABASE", "confession_bot", required=False)
 PG_USER = get_env_var("PGUSER", "postgres", required=False)
 PG_PASSWORD = get_env_var("PGPASSWORD", None, required=False)
+PG_POOL_MIN = get_env_int("PG_POOL_MIN", 5, required=False)
+PG_POOL_MAX = get_env_int("PG_POOL_MAX", 50, required=False)
 
 # Redis Configuration
 REDIS_URL = get_env_var("REDIS_URL", "redis://localhost:6379/0", required=False)
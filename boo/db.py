@@ -58,6 +58,7 @@ def init_db():
             media_height INTEGER,
             media_thumbnail_file_id TEXT,
             rejection_reason TEXT,
+            comment_count INTEGER NOT NULL DEFAULT 0,
             FOREIGN KEY(user_id) REFERENCES users(user_id)
         )''')
         
@@ -73,6 +74,8 @@ def init_db():
             likes INTEGER DEFAULT 0,
             dislikes INTEGER DEFAULT 0,
             flagged INTEGER DEFAULT 0,
+            parent_content_snippet TEXT,
+            parent_timestamp TIMESTAMP,
             FOREIGN KEY(post_id) REFERENCES posts(post_id),
             FOREIGN KEY(user_id) REFERENCES users(user_id),
             FOREIGN KEY(parent_comment_id) REFERENCES comments(comment_id)
@@ -1,4 +1,5 @@
 import os
+import re
 import logging
 import sqlite3
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -7,7 +8,7 @@ from contextlib import contextmanager
 try:
     import psycopg2
     import psycopg2.extras
-    from psycopg2.pool import SimpleConnectionPool
+    from psycopg2.pool import ThreadedConnectionPool
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
@@ -15,11 +16,15 @@ except ImportError:
 
 from config import (
     DATABASE_URL, USE_POSTGRESQL, DB_PATH,
-    PG_HOST, PG_PORT, PG_DATABASE, PG_USER, PG_PASSWORD
+    PG_HOST, PG_PORT, PG_DATABASE, PG_USER, PG_PASSWORD,
+    PG_POOL_MIN, PG_POOL_MAX
 )
 
 logger = logging.getLogger(__name__)
 
+# Constraint violations raised by either backend (FK, UNIQUE, NOT NULL)
+INTEGRITY_ERRORS = (sqlite3.IntegrityError,) + ((psycopg2.IntegrityError,) if PSYCOPG2_AVAILABLE else ())
+
 class DatabaseConnection:
     """Database connection manager supporting both SQLite and PostgreSQL"""
     
@@ -27,6 +32,11 @@ class DatabaseConnection:
         self.use_postgresql = USE_POSTGRESQL or DATABASE_URL is not None
         self.connection_pool = None
         
+        # Named prepared statements (PostgreSQL): name -> (query, param count),
+        # and which of them each pooled connection has already prepared
+        self.prepared_statements: Dict[str, Tuple[str, int]] = {}
+        self._prepared_on: Dict[int, Tuple[Any, set]] = {}
+        
         if self.use_postgresql:
             if not PSYCOPG2_AVAILABLE:
                 logger.error("PostgreSQL requested but psycopg2 not available. Falling back to SQLite.")
@@ -47,10 +57,11 @@ class DatabaseConnection:
                 # Build connection string from individual components
                 connection_string = f"postgresql://{PG_USER}:{PG_PASSWORD}@{PG_HOST}:{PG_PORT}/{PG_DATABASE}"
             
-            # Create connection pool
-            self.connection_pool = SimpleConnectionPool(
-                minconn=1,
-                maxconn=20,
+            # Create connection pool (thread-safe: async handlers run
+            # queries on executor threads)
+            self.connection_pool = ThreadedConnectionPool(
+                minconn=PG_POOL_MIN,
+                maxconn=PG_POOL_MAX,
                 dsn=connection_string
             )
             
@@ -79,10 +90,11 @@ class DatabaseConnection:
             conn = None
             try:
                 conn = self.connection_pool.getconn()
+                self._ensure_prepared(conn)
                 yield conn
             finally:
                 if conn:
-                    self.connection_pool.putconn(conn)
+                    self._release(conn)
         else:
             conn = sqlite3.connect(self.db_path)
             conn.execute('PRAGMA foreign_keys = ON')
@@ -91,6 +103,69 @@ class DatabaseConnection:
             finally:
                 conn.close()
     
+    def register_statement(self, name: str, query: str) -> str:
+        """
+        Register a hot query as a named prepared statement
+        
+        Args:
+            name: Statement name, unique within the process
+            query: Query in SQLite syntax (? placeholders)
+        
+        Returns:
+            The SQL callers should execute: "EXECUTE name (%s, ...)" on
+            PostgreSQL, where the statement is prepared once per pooled
+            connection; the plain adapted query on SQLite, whose statement
+            cache already skips re-parsing identical SQL
+        """
+        query = self.adapt_query_for_db(query)
+        if not self.use_postgresql:
+            return query
+        
+        param_count = query.count('%s')
+        self.prepared_statements[name] = (query, param_count)
+        if not param_count:
+            return f"EXECUTE {name}"
+        return f"EXECUTE {name} ({', '.join(['%s'] * param_count)})"
+    
+    def _ensure_prepared(self, conn):
+        """PREPARE any registered statements this connection has not seen yet"""
+        entry = self._prepared_on.get(id(conn))
+        if entry is None or entry[0] is not conn:
+            entry = (conn, set())
+            self._prepared_on[id(conn)] = entry
+        
+        prepared = entry[1]
+        missing = [name for name in self.prepared_statements if name not in prepared]
+        if not missing:
+            return
+        
+        with conn.cursor() as cursor:
+            for name in missing:
+                query, _ = self.prepared_statements[name]
+                counter = iter(range(1, query.count('%s') + 1))
+                numbered = re.sub(r'%s', lambda _m: f"${next(counter)}", query)
+                try:
+                    cursor.execute(f"PREPARE {name} AS {numbered}")
+                    conn.commit()
+                    prepared.add(name)
+                except Exception as e:
+                    conn.rollback()
+                    logger.warning(f"Could not prepare statement {name}: {e}")
+    
+    def _release(self, conn):
+        """Return a pooled connection, never leaving it inside a transaction"""
+        broken = bool(conn.closed)
+        if not broken and conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            # A read, or a write abandoned by an exception, left a transaction open
+            try:
+                conn.rollback()
+            except Exception as e:
+                logger.warning(f"Discarding pooled connection after failed rollback: {e}")
+                broken = True
+        if broken:
+            self._prepared_on.pop(id(conn), None)
+        self.connection_pool.putconn(conn, close=broken)
+    
     def execute_query(self, query: str, params: Optional[Tuple] = None, fetch: str = None) -> Optional[List]:
         """
         Execute a query and optionally fetch results
@@ -117,7 +192,9 @@ class DatabaseConnection:
                             conn.commit()
                             return cursor.rowcount
                 else:
-                    # SQLite
+                    # SQLite: sqlite3.Row gives the same key access as RealDictCursor
+                    # while keeping index access for existing callers
+                    conn.row_factory = sqlite3.Row
                     cursor = conn.cursor()
                     cursor.execute(query, params or ())
                     
@@ -135,6 +212,53 @@ class DatabaseConnection:
             logger.error(f"Params: {params}")
             raise
     
+    def execute_batch(self, cursor, query: str, params_list: List[Tuple], page_size: int = 500):
+        """
+        Run one statement for many parameter tuples on an open cursor
+        
+        PostgreSQL pipelines the statements with execute_batch so a page of
+        rows costs one round trip; SQLite uses executemany.
+        """
+        if self.use_postgresql:
+            psycopg2.extras.execute_batch(cursor, query, params_list, page_size=page_size)
+        else:
+            cursor.executemany(query, params_list)
+    
+    def execute_many(self, query: str, params_list: List[Tuple], page_size: int = 500) -> int:
+        """
+        Execute a write query for every parameter tuple in a single transaction
+        
+        Args:
+            query: SQL query to execute
+            params_list: Sequence of parameter tuples
+            page_size: Statements sent per round trip (PostgreSQL only)
+        
+        Returns:
+            Number of parameter tuples executed
+        """
+        params_list = list(params_list)
+        if not params_list:
+            return 0
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    self.execute_batch(cursor, query, params_list, page_size)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    cursor.close()
+                return len(params_list)
+        
+        except Exception as e:
+            logger.error(f"Database batch error: {e}")
+            logger.error(f"Query: {query}")
+            logger.error(f"Rows: {len(params_list)}")
+            raise
+    
     def get_placeholder(self) -> str:
         """Get the appropriate parameter placeholder for the database type"""
         return "%s" if self.use_postgresql else "?"
@@ -177,6 +301,7 @@ class DatabaseConnection:
         """Close database connections"""
         if self.use_postgresql and self.connection_pool:
             self.connection_pool.closeall()
+            self._prepared_on.clear()
             logger.info("PostgreSQL connection pool closed")
 
 # Global database connection instance
@@ -195,6 +320,14 @@ def execute_query(query: str, params: Optional[Tuple] = None, fetch: str = None)
     """Execute query using global connection"""
     return db_connection.execute_query(query, params, fetch)
 
+def execute_many(query: str, params_list: List[Tuple], page_size: int = 500) -> int:
+    """Execute a write query for many parameter tuples using global connection"""
+    return db_connection.execute_many(query, params_list, page_size)
+
 def adapt_query(query: str) -> str:
     """Adapt query for current database type"""
     return db_connection.adapt_query_for_db(query)
+
+def register_statement(name: str, query: str) -> str:
+    """Register a prepared statement on the global connection"""
+    return db_connection.register_statement(name, query)
@@ -7,26 +7,76 @@ from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
 from typing import List, Dict, Optional
 import math
+import bisect
+import asyncio
+import hashlib
 from datetime import datetime, timedelta
 
 from enhanced_ranking_system import EnhancedPointSystem, EnhancedAchievementSystem
 from enhanced_leaderboard import EnhancedLeaderboardManager, LeaderboardType
 from enhanced_ranking_system import UserRank
-from ranking_integration import ranking_manager
+from ranking_integration import ranking_manager, ACHIEVEMENTS_PAGE_SIZE
+from rank_ladder import show_rank_ladder
+import cache
 from utils import escape_markdown_text
 from logger import get_logger
 
 logger = get_logger('enhanced_ranking_ui')
 
+# Escapes decimal points for MarkdownV2 in a single translate pass
+_MD_NUMBER_ESCAPE = str.maketrans({'.': '\\.'})
+
 def format_number_for_markdown(value: float, decimal_places: int = 1) -> str:
     """Format a number for MarkdownV2 display, escaping decimal points"""
     if decimal_places == 0:
-        formatted = f"{value:.0f}"
-    else:
-        formatted = f"{value:.{decimal_places}f}"
+        # No decimal point to escape
+        return f"{value:.0f}"
     
-    # Escape decimal points for MarkdownV2
-    return formatted.replace('.', '\.')  
+    return f"{value:.{decimal_places}f}".translate(_MD_NUMBER_ESCAPE)
+
+# Streak messages by lower bound: bisect over _STREAK_BOUNDS picks the template
+_STREAK_BOUNDS = (1, 7, 30, 90, 365)
+_STREAK_TEMPLATES = (
+    "📅 No streak yet - start your journey!",
+    "🔥 {} day streak - keep it up!",
+    "⚡ {} day streak - you're on fire!",
+    "🚀 {} day streak - amazing dedication!",
+    "👑 {} day streak - you're a legend!",
+    "🌟 {} day streak - ULTIMATE DEVOTEE!",
+)
+# Same templates escaped for MarkdownV2 around the placeholder
+_STREAK_TEMPLATES_MD = tuple(
+    "{}".join(escape_markdown_text(part) for part in template.split("{}"))
+    for template in _STREAK_TEMPLATES
+)
+
+# Rank type tags, escaped for MarkdownV2
+_SPECIAL_TAG = escape_markdown_text("(⭐ SPECIAL RANK)")
+_STD_TAG = escape_markdown_text("(📊 Standard Rank)")
+
+# Every fill level of the progress bars (█ solid block, ░ light shade),
+# indexed by the number of filled blocks
+_BAR12 = ["█" * i + "░" * (12 - i) for i in range(13)]
+_BAR15 = ["█" * i + "░" * (15 - i) for i in range(16)]
+_BARS = {12: _BAR12, 15: _BAR15}
+
+# Static keyboards, built once and reused for every callback
+_RANK_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🪜 Rank Ladder", callback_data="rank_ladder")],
+    [InlineKeyboardButton("📖 Point Guide", callback_data="rank_point_guide")],
+    [InlineKeyboardButton("🎖️ My Achievement", callback_data="achievement_view_my")],
+    [InlineKeyboardButton("🏠 Main Menu", callback_data="menu")]
+])
+_BACK_TO_RANK_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔙 Back", callback_data="enhanced_ranking")]
+])
+_GUIDE_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔙 Back to Rank Menu", callback_data="enhanced_ranking")]
+])
+
+def build_rank_menu_markup() -> InlineKeyboardMarkup:
+    """Keyboard shown under the rank card"""
+    return _RANK_MENU_MARKUP
 
 class EnhancedRankingUI:
     """Enhanced UI components with better visualizations"""
@@ -34,20 +84,18 @@ class EnhancedRankingUI:
     @staticmethod
     def create_advanced_progress_bar(current: int, maximum: int, length: int = 15) -> str:
         """Create an advanced progress bar with realistic loading appearance"""
+        bars = _BARS.get(length)
         if maximum == 0:
-            return "█" * length + " 100% MAXED!"
+            full_bar = bars[length] if bars else "█" * length
+            return full_bar + " 100% MAXED!"
         
         # Ensure we don't have negative values
         current = max(0, current)
         progress = min(current / maximum, 1.0) if maximum > 0 else 0
         filled = int(progress * length)
-        empty = length - filled
-        
-        # Use realistic loading bar characters
-        fill_char = "█"  # Solid block
-        empty_char = "░"  # Light shade
         
-        bar = fill_char * filled + empty_char * empty
+        # Use realistic loading bar characters (precomputed for the usual lengths)
+        bar = bars[filled] if bars else "█" * filled + "░" * (length - filled)
         percentage = f"{int(progress * 100)}%"
         
         return f"{bar} {percentage}"
@@ -55,21 +103,15 @@ class EnhancedRankingUI:
     @staticmethod
     def create_streak_visualization(streak_days: int) -> str:
         """Create visual representation of streak"""
-        if streak_days == 0:
-            return "📅 No streak yet - start your journey!"
-        elif streak_days < 7:
-            return f"🔥 {streak_days} day streak - keep it up!"
-        elif streak_days < 30:
-            return f"⚡ {streak_days} day streak - you're on fire!"
-        elif streak_days < 90:
-            return f"🚀 {streak_days} day streak - amazing dedication!"
-        elif streak_days < 365:
-            return f"👑 {streak_days} day streak - you're a legend!"
-        else:
-            return f"🌟 {streak_days} day streak - ULTIMATE DEVOTEE!"
+        return _STREAK_TEMPLATES[bisect.bisect_right(_STREAK_BOUNDS, streak_days)].format(streak_days)
     
     @staticmethod
-    def format_enhanced_rank_display(user_rank: UserRank, user_id: int) -> str:
+    def create_streak_visualization_markdown(streak_days: int) -> str:
+        """Streak visualization already escaped for MarkdownV2"""
+        return _STREAK_TEMPLATES_MD[bisect.bisect_right(_STREAK_BOUNDS, streak_days)].format(streak_days)
+    
+    @staticmethod
+    def format_enhanced_rank_display(user_rank: UserRank, achievement_count: int) -> str:
         """Enhanced rank display with more visual elements"""
         # Calculate progress to next rank with debugging info
         if user_rank.points_to_next > 0:
@@ -83,81 +125,92 @@ class EnhancedRankingUI:
             
             # Create the visual progress bar
             filled_blocks = int((progress_percentage / 100) * 12)
-            empty_blocks = 12 - filled_blocks
-            progress_bar = f"{'█' * filled_blocks}{'░' * empty_blocks} {progress_percentage}%"
+            progress_bar = f"{_BAR12[filled_blocks]} {progress_percentage}%"
             
             next_rank_text = f"Next: {user_rank.points_to_next:,} points to go"
             
         else:
-            progress_bar = "████████████ 100% MAXED!"
+            progress_bar = f"{_BAR12[12]} 100% MAXED!"
             next_rank_text = "🎉 Maximum rank achieved!"
         
-        # Get streak visualization
-        from db_connection import get_db_connection
-        db_conn = get_db_connection()
-        with db_conn.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT consecutive_days FROM user_rankings WHERE user_id = ?", (user_id,))
-            result = cursor.fetchone()
-            streak_days = result[0] if result else 0
-        
-        streak_viz = EnhancedRankingUI.create_streak_visualization(streak_days)
+        # Get streak visualization (streak comes with the rank query)
+        streak_viz = EnhancedRankingUI.create_streak_visualization_markdown(user_rank.streak_days)
         
         # Special rank indicator
-        rank_indicator = "⭐ SPECIAL RANK" if user_rank.is_special_rank else "📊 Standard Rank"
+        rank_tag = _SPECIAL_TAG if user_rank.is_special_rank else _STD_TAG
         
         rank_text = f"""
  🏆 *YOUR RANKING STATUS*
 
- {escape_markdown_text(user_rank.rank_emoji)} **{escape_markdown_text(user_rank.rank_name)}** {escape_markdown_text('(' + rank_indicator + ')')}
+ {escape_markdown_text(user_rank.rank_emoji)} **{escape_markdown_text(user_rank.rank_name)}** {rank_tag}
  💎 **{user_rank.total_points:,} Total Points**
 
  📈 *Progress to Next Rank*
  {progress_bar}
  {escape_markdown_text(next_rank_text)}
 
- {escape_markdown_text(streak_viz)}
+ {streak_viz}
 
  🎯 **{user_rank.total_points:,}** total points earned
- 🏅 **{ranking_manager.get_user_achievements(user_id).__len__()}** achievements unlocked
+ 🏅 **{achievement_count}** achievements unlocked
  """
         
         return rank_text
 
 
+# How long to remember what we last rendered into a message
+UI_DIGEST_TTL = 600
+
+async def _edit_if_changed(query, text: str, reply_markup: InlineKeyboardMarkup):
+    """Edit the callback's message unless it already shows this text and keyboard"""
+    message = query.message
+    digest_key = None
+    if message is not None:
+        digest = hashlib.blake2b((text + reply_markup.to_json()).encode(), digest_size=16).hexdigest()
+        digest_key = f"ui:last:{message.chat_id}:{message.message_id}"
+        
+        # The digest only records our own edits; other handlers may have edited
+        # the message since, so the keyboard on screen must match as well
+        if message.reply_markup == reply_markup and cache.get_json(digest_key) == digest:
+            return
+    
+    await query.edit_message_text(
+        text=text,
+        reply_markup=reply_markup,
+        parse_mode='MarkdownV2'
+    )
+    
+    if digest_key:
+        cache.set_json(digest_key, digest, UI_DIGEST_TTL)
+
+
 async def show_enhanced_ranking_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show the enhanced ranking menu"""
     try:
         user_id = update.effective_user.id
-        user_rank = ranking_manager.get_user_rank(user_id)
+        
+        # Both reads are independent, so run them concurrently
+        user_rank, achievement_count = await asyncio.gather(
+            ranking_manager.get_user_rank_async(user_id),
+            ranking_manager.get_user_achievement_count_async(user_id)
+        )
         
         if not user_rank:
             # Initialize user ranking if it doesn't exist
-            ranking_manager.initialize_user_ranking(user_id)
-            user_rank = ranking_manager.get_user_rank(user_id)
+            await ranking_manager.initialize_user_ranking_async(user_id)
+            user_rank = await ranking_manager.get_user_rank_async(user_id)
         
         if not user_rank:
             await update.callback_query.answer("❌ Unable to load your ranking data. Please try again later.")
             return
         
         # Create ranking display
-        rank_display = EnhancedRankingUI.format_enhanced_rank_display(user_rank, user_id)
+        rank_display = EnhancedRankingUI.format_enhanced_rank_display(user_rank, achievement_count)
         
-        # Create keyboard with options
-        keyboard = [
-            [InlineKeyboardButton("🪜 Rank Ladder", callback_data="rank_ladder")],
-            [InlineKeyboardButton("📖 Point Guide", callback_data="rank_point_guide")],
-            [InlineKeyboardButton("🎖️ My Achievement", callback_data="achievement_view_my")],
-            [InlineKeyboardButton("🏠 Main Menu", callback_data="menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = build_rank_menu_markup()
         
         if update.callback_query:
-            await update.callback_query.edit_message_text(
-                text=rank_display,
-                reply_markup=reply_markup,
-                parse_mode='MarkdownV2'
-            )
+            await _edit_if_changed(update.callback_query, rank_display, reply_markup)
         else:
             await update.message.reply_text(
                 text=rank_display,
@@ -174,126 +227,113 @@ async def show_enhanced_ranking_menu(update: Update, context: ContextTypes.DEFAU
             await update.message.reply_text(error_message)
 
 
+async def _show_achievements(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show the user's unlocked achievements"""
+    query = update.callback_query
+    achievements = await ranking_manager.get_user_achievements_async(update.effective_user.id, limit=ACHIEVEMENTS_PAGE_SIZE)
+    
+    if not achievements:
+        achievement_text = "🎖️ *YOUR ACHIEVEMENTS*\n\n❌ No achievements unlocked yet\!"
+    else:
+        achievement_text = "🎖️ *YOUR ACHIEVEMENTS*\n\n"
+        for achievement in achievements:
+            special_indicator = "⭐" if achievement.get('is_special') else "🏅"
+            achievement_text += f"{special_indicator} *{escape_markdown_text(achievement.get('name', 'Unknown'))}*\n"
+            achievement_text += f"   {escape_markdown_text(achievement.get('description', 'No description'))}\n"
+            achievement_text += f"   \+{achievement.get('points', 0)} points\n\n"
+    
+    await _edit_if_changed(query, achievement_text, _BACK_TO_RANK_MARKUP)
+
+
+async def _feature_coming_soon(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Fallback for ranking callbacks without a handler yet"""
+    await update.callback_query.answer("Feature coming soon!")
+
+
 async def enhanced_ranking_callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle enhanced ranking callback queries"""
     query = update.callback_query
     await query.answer()
     
     try:
-        data = query.data
-        user_id = update.effective_user.id
+        handler = _CALLBACK_TABLE.get(query.data, _feature_coming_soon)
+        await handler(update, context)
         
-        if data == "enhanced_ranking":
-            await show_enhanced_ranking_menu(update, context)
-            
-            
-        elif data == "achievement_view_my":
-            achievements = ranking_manager.get_user_achievements(user_id)
-            
-            if not achievements:
-                achievement_text = "🎖️ *YOUR ACHIEVEMENTS*\n\n❌ No achievements unlocked yet\!"
-            else:
-                achievement_text = "🎖️ *YOUR ACHIEVEMENTS*\n\n"
-                for achievement in achievements[:10]:  # Show first 10
-                    special_indicator = "⭐" if achievement.get('is_special') else "🏅"
-                    achievement_text += f"{special_indicator} *{escape_markdown_text(achievement.get('name', 'Unknown'))}*\n"
-                    achievement_text += f"   {escape_markdown_text(achievement.get('description', 'No description'))}\n"
-                    achievement_text += f"   \+{achievement.get('points', 0)} points\n\n"
-            
-            keyboard = [
-                [InlineKeyboardButton("🔙 Back", callback_data="enhanced_ranking")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text(
-                text=achievement_text,
-                reply_markup=reply_markup,
-                parse_mode='MarkdownV2'
-            )
-            
-        elif data == "rank_ladder":
-            # Show the rank ladder
-            from rank_ladder import show_rank_ladder
-            await show_rank_ladder(update, context)
-            
-        elif data == "rank_point_guide":
-            # Show point system guide
-            await show_point_guide(update, context)
-            
-        
-        else:
-            # Handle other ranking-related callbacks
-            await query.answer("Feature coming soon!")
-            
     except Exception as e:
         logger.error(f"Error in enhanced_ranking_callback_handler: {e}")
         await query.answer("❌ An error occurred. Please try again.")
 
 
+# Point guide content: (section heading, raw lines); each section body is
+# escaped for MarkdownV2 in a single call
+_POINT_GUIDE_SECTIONS = (
+    ("🙊 *Confession Activities:*", (
+        "• Approved Confession: +50 points",
+        "• Featured Confession: +75 points",
+        "• Viral Confession (200+ likes): +200 points",
+        "• Popular Post (trending): +125 points",
+    )),
+    ("💬 *Comment Activities:*", (
+        "• Post Comment: +8 points",
+        "• Comment Gets Liked: +2 points per like",
+        "• Viral Comment (50+ likes): +50 points",
+        "• Quality Comment (admin marked): +30 points",
+    )),
+    ("📅 *Daily Activities:*", (
+        "• Daily Login: +5 points",
+        "• Week Streak: +50 points",
+        "• Month Streak: +200 points",
+        "• Year Streak: +1000 points",
+    )),
+    ("⭐ *Special Bonuses:*", (
+        "• First Confession: +75 points",
+        "• High Quality Content: +40 points",
+        "• Community Help: +25 points",
+        "• Weekend Activity: +10% bonus",
+    )),
+    ("⚠️ *Penalties:*", (
+        "• Content Rejected: -3 points",
+        "• Spam Detected: -10 points",
+        "• Inappropriate Content: -20 points",
+    )),
+    ("💡 *Tips:*", (
+        "• Longer posts (500+ chars) get bonus points",
+        "• Consistency pays off with streak multipliers",
+        "• Quality content gets admin bonuses",
+        "• Engaging with others earns reaction points",
+    )),
+)
+
+
+def _build_point_guide() -> str:
+    """Render the static point system guide (MarkdownV2)"""
+    parts = ["📖 *POINT SYSTEM GUIDE*\n\n"]
+    parts.append(escape_markdown_text("Learn how to earn points and climb the ranking system!") + "\n\n")
+    
+    for heading, lines in _POINT_GUIDE_SECTIONS:
+        parts.append(heading + "\n" + escape_markdown_text("\n".join(lines)) + "\n\n")
+    
+    parts.append("🚀 *" + escape_markdown_text("Stay active and create quality content to maximize your points!") + "*")
+    
+    return "".join(parts)
+
+
+# The guide is static, so it is rendered once at import
+_POINT_GUIDE_TEXT = _build_point_guide()
+
+def build_point_guide() -> str:
+    """Point system guide text (MarkdownV2)"""
+    return _POINT_GUIDE_TEXT
+
+
 async def show_point_guide(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show the point system guide explaining how points are earned"""
     try:
-        from enhanced_ranking_system import EnhancedPointSystem
-        
-        guide_text = "📖 *POINT SYSTEM GUIDE*\n\n"
-        guide_text += escape_markdown_text("Learn how to earn points and climb the ranking system!") + "\n\n"
-        
-        # Confession activities
-        guide_text += "🙊 *Confession Activities:*\n"
-        guide_text += escape_markdown_text("• Approved Confession: +50 points") + "\n"
-        guide_text += escape_markdown_text("• Featured Confession: +75 points") + "\n"
-        guide_text += escape_markdown_text("• Viral Confession (200+ likes): +200 points") + "\n"
-        guide_text += escape_markdown_text("• Popular Post (trending): +125 points") + "\n\n"
-        
-        # Comment activities
-        guide_text += "💬 *Comment Activities:*\n"
-        guide_text += escape_markdown_text("• Post Comment: +8 points") + "\n"
-        guide_text += escape_markdown_text("• Comment Gets Liked: +2 points per like") + "\n"
-        guide_text += escape_markdown_text("• Viral Comment (50+ likes): +50 points") + "\n"
-        guide_text += escape_markdown_text("• Quality Comment (admin marked): +30 points") + "\n\n"
-        
-        # Daily activities
-        guide_text += "📅 *Daily Activities:*\n"
-        guide_text += escape_markdown_text("• Daily Login: +5 points") + "\n"
-        guide_text += escape_markdown_text("• Week Streak: +50 points") + "\n"
-        guide_text += escape_markdown_text("• Month Streak: +200 points") + "\n"
-        guide_text += escape_markdown_text("• Year Streak: +1000 points") + "\n\n"
-        
-        # Special bonuses
-        guide_text += "⭐ *Special Bonuses:*\n"
-        guide_text += escape_markdown_text("• First Confession: +75 points") + "\n"
-        guide_text += escape_markdown_text("• High Quality Content: +40 points") + "\n"
-        guide_text += escape_markdown_text("• Community Help: +25 points") + "\n"
-        guide_text += escape_markdown_text("• Weekend Activity: +10% bonus") + "\n\n"
-        
-        # Penalties
-        guide_text += "⚠️ *Penalties:*\n"
-        guide_text += escape_markdown_text("• Content Rejected: -3 points") + "\n"
-        guide_text += escape_markdown_text("• Spam Detected: -10 points") + "\n"
-        guide_text += escape_markdown_text("• Inappropriate Content: -20 points") + "\n\n"
-        
-        guide_text += "💡 *Tips:*\n"
-        guide_text += escape_markdown_text("• Longer posts (500+ chars) get bonus points") + "\n"
-        guide_text += escape_markdown_text("• Consistency pays off with streak multipliers") + "\n"
-        guide_text += escape_markdown_text("• Quality content gets admin bonuses") + "\n"
-        guide_text += escape_markdown_text("• Engaging with others earns reaction points") + "\n\n"
-        
-        guide_text += "🚀 *" + escape_markdown_text("Stay active and create quality content to maximize your points!") + "*"
-        
-        # Create keyboard with back button
-        keyboard = [
-            [
-                InlineKeyboardButton("🔙 Back to Rank Menu", callback_data="enhanced_ranking")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        guide_text = build_point_guide()
+        reply_markup = _GUIDE_MARKUP
         
         if update.callback_query:
-            await update.callback_query.edit_message_text(
-                guide_text,
-                parse_mode="MarkdownV2",
-                reply_markup=reply_markup
-            )
+            await _edit_if_changed(update.callback_query, guide_text, reply_markup)
         else:
             await update.message.reply_text(
                 guide_text,
@@ -308,3 +348,16 @@ async def show_point_guide(update: Update, context: ContextTypes.DEFAULT_TYPE):
             await update.callback_query.answer(error_message)
         else:
             await update.message.reply_text(error_message)
+
+
+# Callback data -> handler for enhanced_ranking_callback_handler
+_CALLBACK_TABLE = {
+    "enhanced_ranking": show_enhanced_ranking_menu,
+    "achievement_view_my": _show_achievements,
+    "rank_ladder": show_rank_ladder,
+    "rank_point_guide": show_point_guide,
+}
+
+def handled_callbacks() -> frozenset:
+    """Callback data values enhanced_ranking_callback_handler dispatches"""
+    return frozenset(_CALLBACK_TABLE)
@@ -44,6 +44,31 @@ class Migration:
                     'id': '004_update_constraints',
                     'description': 'Update database constraints for PostgreSQL',
                     'function': self._migration_004_update_constraints
+                },
+                {
+                    'id': '005_comment_navigation_indexes',
+                    'description': 'Add indexes for comment page navigation',
+                    'function': self._migration_005_comment_navigation_indexes
+                },
+                {
+                    'id': '006_add_post_comment_count',
+                    'description': 'Add denormalized comment_count column to posts table',
+                    'function': self._migration_006_add_post_comment_count
+                },
+                {
+                    'id': '007_comment_timestamp_index',
+                    'description': 'Add (post_id, timestamp) index on comments',
+                    'function': self._migration_007_comment_timestamp_index
+                },
+                {
+                    'id': '008_add_comment_parent_snapshot',
+                    'description': 'Copy quoted parent content and timestamp onto replies',
+                    'function': self._migration_008_add_comment_parent_snapshot
+                },
+                {
+                    'id': '009_user_achievements_index',
+                    'description': 'Add (user_id, achieved_at) index on user_achievements',
+                    'function': self._migration_009_user_achievements_index
                 }
             ]
             
@@ -303,6 +328,104 @@ class Migration:
                 logger.info(f"Created index: {index_query}")
             except Exception as e:
                 logger.warning(f"Could not create index: {e}")
+    
+    def _migration_005_comment_navigation_indexes(self):
+        """Migration 005: Add indexes for comment page navigation"""
+        
+        # Partial index over top-level comments
+        indexes = [
+            "CREATE INDEX IF NOT EXISTS idx_comments_post_toplevel_ts ON comments(post_id, timestamp) WHERE parent_comment_id IS NULL",
+        ]
+        
+        for index_query in indexes:
+            try:
+                execute_query(index_query)
+                logger.info(f"Created index: {index_query}")
+            except Exception as e:
+                logger.warning(f"Could not create index: {e}")
+    
+    def _migration_006_add_post_comment_count(self):
+        """Migration 006: Add comment_count column to posts"""
+        
+        try:
+            execute_query("ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0")
+            logger.info("Added column comment_count to posts table")
+        except Exception as e:
+            if "already exists" in str(e).lower() or "duplicate column" in str(e).lower():
+                logger.info("Column comment_count already exists, skipping")
+            else:
+                raise
+        
+        # Backfill from existing comments
+        execute_query("""
+        UPDATE posts SET comment_count = (
+            SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.post_id
+        )
+        """)
+        logger.info("Backfilled comment_count for existing posts")
+    
+    def _migration_007_comment_timestamp_index(self):
+        """Migration 007: Index comments by post and timestamp"""
+        
+        # Serves the sequential-number count (post_id = ? AND timestamp <= ?)
+        indexes = [
+            "CREATE INDEX IF NOT EXISTS idx_comments_post_id_timestamp ON comments(post_id, timestamp)",
+        ]
+        
+        for index_query in indexes:
+            try:
+                execute_query(index_query)
+                logger.info(f"Created index: {index_query}")
+            except Exception as e:
+                logger.warning(f"Could not create index: {e}")
+    
+    def _migration_008_add_comment_parent_snapshot(self):
+        """Migration 008: Add parent snapshot columns to comments"""
+        
+        snapshot_columns = [
+            ("parent_content_snippet", "TEXT"),
+            ("parent_timestamp", "TIMESTAMP")
+        ]
+        
+        for column_name, column_type in snapshot_columns:
+            try:
+                execute_query(f"ALTER TABLE comments ADD COLUMN {column_name} {column_type}")
+                logger.info(f"Added column {column_name} to comments table")
+            except Exception as e:
+                if "already exists" in str(e).lower() or "duplicate column" in str(e).lower():
+                    logger.info(f"Column {column_name} already exists, skipping")
+                else:
+                    raise
+        
+        # Backfill existing replies
+        execute_query("""
+        UPDATE comments SET
+            parent_content_snippet = (
+                SELECT CASE WHEN length(p.content) > 150 THEN substr(p.content, 1, 150) || '...' ELSE p.content END
+                FROM comments p WHERE p.comment_id = comments.parent_comment_id
+            ),
+            parent_timestamp = (
+                SELECT p.timestamp FROM comments p WHERE p.comment_id = comments.parent_comment_id
+            )
+        WHERE parent_comment_id IS NOT NULL
+        """)
+        logger.info("Backfilled parent snapshots for existing replies")
+    
+    def _migration_009_user_achievements_index(self):
+        """Migration 009: Index achievements by user, newest first"""
+        
+        # Serves the per-user achievements page and count; user_rankings is
+        # already keyed by user_id
+        indexes = [
+            "CREATE INDEX IF NOT EXISTS idx_user_achievements_user_id_achieved_at ON user_achievements(user_id, achieved_at DESC)",
+        ]
+        
+        for index_query in indexes:
+            try:
+                execute_query(index_query)
+                logger.info(f"Created index: {index_query}")
+            except Exception as e:
+                logger.warning(f"Could not create index: {e}")
 
 def run_database_migrations():
     """Run all database migrations"""
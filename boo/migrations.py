@@ -434,6 +434,84 @@ class MigrationManager:
                 -- This would revert back to NOT NULL constraint
                 -- Not recommended as it could break existing media-only posts
                 """
+            ),
+            
+            # Version 16: Index top-level comments for page navigation
+            Migration(
+                version=16,
+                name="add_comment_toplevel_index",
+                up_sql="""
+                CREATE INDEX IF NOT EXISTS idx_comments_post_toplevel_ts
+                ON comments(post_id, timestamp) WHERE parent_comment_id IS NULL;
+                """,
+                down_sql="DROP INDEX IF EXISTS idx_comments_post_toplevel_ts;"
+            ),
+            
+            # Version 17: Denormalized comment counter on posts
+            Migration(
+                version=17,
+                name="add_post_comment_count",
+                up_sql="""
+                ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0;
+                
+                -- Backfill from existing comments
+                UPDATE posts SET comment_count = (
+                    SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.post_id
+                );
+                """,
+                down_sql="""
+                -- Note: SQLite doesn't support dropping columns easily
+                -- This would require recreating the table without the column
+                """
+            ),
+            
+            # Version 18: Restore the (post_id, timestamp) comment index
+            Migration(
+                version=18,
+                name="ensure_comment_post_timestamp_index",
+                up_sql="""
+                -- Version 8 created this index, but databases whose comments
+                -- table was rebuilt afterwards lost it
+                CREATE INDEX IF NOT EXISTS idx_comments_post_id_timestamp ON comments(post_id, timestamp);
+                """,
+                down_sql="DROP INDEX IF EXISTS idx_comments_post_id_timestamp;"
+            ),
+            
+            # Version 19: Copy the quoted parent onto replies
+            Migration(
+                version=19,
+                name="add_comment_parent_snapshot",
+                up_sql="""
+                ALTER TABLE comments ADD COLUMN parent_content_snippet TEXT;
+                ALTER TABLE comments ADD COLUMN parent_timestamp TIMESTAMP;
+                
+                -- Backfill existing replies
+                UPDATE comments SET
+                    parent_content_snippet = (
+                        SELECT CASE WHEN length(p.content) > 150 THEN substr(p.content, 1, 150) || '...' ELSE p.content END
+                        FROM comments p WHERE p.comment_id = comments.parent_comment_id
+                    ),
+                    parent_timestamp = (
+                        SELECT p.timestamp FROM comments p WHERE p.comment_id = comments.parent_comment_id
+                    )
+                WHERE parent_comment_id IS NOT NULL;
+                """,
+                down_sql="""
+                -- Note: SQLite doesn't support dropping columns easily
+                -- This would require recreating the table without the columns
+                """
+            ),
+            
+            # Version 20: Index achievements by user, newest first
+            Migration(
+                version=20,
+                name="add_user_achievements_index",
+                up_sql="""
+                -- Serves the per-user achievements page and count. user_rankings
+                -- needs no index: user_id is its primary key.
+                CREATE INDEX IF NOT EXISTS idx_user_achievements_user_id_achieved_at ON user_achievements(user_id, achieved_at DESC);
+                """,
+                down_sql="DROP INDEX IF EXISTS idx_user_achievements_user_id_achieved_at;"
             )
         ]
     
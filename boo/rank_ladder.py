@@ -5,6 +5,7 @@ Shows the complete hierarchy of ranks and their point requirements
 """
 
 import sqlite3
+import asyncio
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
 from typing import List, Dict, Tuple
@@ -16,12 +17,36 @@ from ranking_integration import ranking_manager
 
 logger = get_logger('rank_ladder')
 
+_LADDER_HEADER = (
+    "🪜 *RANK LADDER*\n\n"
+    + escape_markdown_text("Complete hierarchy of all available ranks and their requirements.")
+    + "\n" + escape_markdown_text("Your current position is highlighted.") + "\n\n"
+)
+
+# Static back button under the ladder
+_LADDER_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔙 Back to Rank Menu", callback_data="enhanced_ranking")]
+])
+
+def build_ladder_markup() -> InlineKeyboardMarkup:
+    """Keyboard shown under the rank ladder"""
+    return _LADDER_MARKUP
+
+# Rank definitions are seeded by migrations and never change at runtime,
+# so they and the rendered ladder (which only varies by the highlighted
+# rank) are built once per process
+_all_ranks: List[Dict] = []
+_ladder_bodies: Dict[int, str] = {}
+
 class RankLadderDisplay:
     """Display complete rank hierarchy and user's position in it"""
     
     @staticmethod
     def get_all_ranks() -> List[Dict]:
         """Get all rank definitions from the database"""
+        if _all_ranks:
+            return _all_ranks
+        
         try:
             with sqlite3.connect(DB_PATH) as conn:
                 cursor = conn.cursor()
@@ -45,38 +70,21 @@ class RankLadderDisplay:
                         'is_special': bool(is_special)
                     })
                 
-                return ranks
+                # Only keep a successful load so a transient error is retried
+                _all_ranks[:] = ranks
+                return _all_ranks
         except Exception as e:
             logger.error(f"Error getting rank definitions: {e}")
             return []
     
     @staticmethod
-    def format_rank_ladder(user_id: int) -> str:
-        """Format the complete rank ladder/hierarchy with user's current position"""
-        ranks = RankLadderDisplay.get_all_ranks()
-        if not ranks:
-            return "⚠️ " + escape_markdown_text("Error loading rank information. Please try again later.")
+    def format_ladder_body(ranks: List[Dict], user_rank_id: int) -> str:
+        """Format the rank entries with user_rank_id highlighted (memoized per rank)"""
+        cached = _ladder_bodies.get(user_rank_id)
+        if cached is not None:
+            return cached
         
-        # Get user's current rank (create if doesn't exist)
-        try:
-            user_rank = ranking_manager.get_user_rank(user_id)
-            if not user_rank:
-                # Initialize user ranking if it doesn't exist
-                ranking_manager.initialize_user_ranking(user_id)
-                user_rank = ranking_manager.get_user_rank(user_id)
-            
-            user_total_points = user_rank.total_points if user_rank else 0
-            user_rank_id = user_rank.rank_level if user_rank else 1
-        except Exception as e:
-            logger.warning(f"Could not get user rank for ladder display: {e}")
-            user_rank = None
-            user_total_points = 0
-            user_rank_id = 1  # Default to first rank
-        
-        # Format the rank ladder
-        ladder_text = "🪜 *RANK LADDER*\n\n"
-        ladder_text += escape_markdown_text("Complete hierarchy of all available ranks and their requirements.")
-        ladder_text += "\n" + escape_markdown_text("Your current position is highlighted.") + "\n\n"
+        ladder_text = ""
         
         # Create a visual ladder of all ranks
         for rank in ranks:
@@ -132,6 +140,35 @@ class RankLadderDisplay:
             # Add separator between ranks
             ladder_text += "\n"
         
+        _ladder_bodies[user_rank_id] = ladder_text
+        return ladder_text
+    
+    @staticmethod
+    def format_rank_ladder(user_id: int) -> str:
+        """Format the complete rank ladder/hierarchy with user's current position"""
+        ranks = RankLadderDisplay.get_all_ranks()
+        if not ranks:
+            return "⚠️ " + escape_markdown_text("Error loading rank information. Please try again later.")
+        
+        # Get user's current rank (create if doesn't exist)
+        try:
+            user_rank = ranking_manager.get_user_rank(user_id)
+            if not user_rank:
+                # Initialize user ranking if it doesn't exist
+                ranking_manager.initialize_user_ranking(user_id)
+                user_rank = ranking_manager.get_user_rank(user_id)
+            
+            user_total_points = user_rank.total_points if user_rank else 0
+            user_rank_id = user_rank.rank_level if user_rank else 1
+        except Exception as e:
+            logger.warning(f"Could not get user rank for ladder display: {e}")
+            user_rank = None
+            user_total_points = 0
+            user_rank_id = 1  # Default to first rank
+        
+        # Format the rank ladder
+        ladder_text = _LADDER_HEADER + RankLadderDisplay.format_ladder_body(ranks, user_rank_id)
+        
         # Add user's current progress information
         if user_rank:
             points_to_next = user_rank.points_to_next
@@ -150,16 +187,10 @@ async def show_rank_ladder(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show the complete rank ladder with user's position"""
     user_id = update.effective_user.id
     
-    # Format the rank ladder text
-    ladder_text = RankLadderDisplay.format_rank_ladder(user_id)
+    # Format the rank ladder text (reads the database, so off the event loop)
+    ladder_text = await asyncio.to_thread(RankLadderDisplay.format_rank_ladder, user_id)
     
-    # Create keyboard with back button
-    keyboard = [
-        [
-            InlineKeyboardButton("🔙 Back to Rank Menu", callback_data="enhanced_ranking")
-        ]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = build_ladder_markup()
     
     if update.callback_query:
         await update.callback_query.edit_message_text(
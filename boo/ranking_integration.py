@@ -4,19 +4,31 @@ Connects point awards to user actions throughout the bot
 """
 
 import sqlite3
+import asyncio
+import threading
 from datetime import datetime
 from telegram import Update
 from telegram.ext import ContextTypes
 from typing import Optional, Tuple, Dict, Any
+from dataclasses import asdict
 import logging
 
 # Import ranking system components
 from enhanced_ranking_system import EnhancedPointSystem, EnhancedAchievementSystem, UserRank
 from config import DB_PATH, ADMIN_IDS
 from utils import escape_markdown_text
+import cache
+from cache import cached
 
 logger = logging.getLogger(__name__)
 
+# Short TTL for per-user ranking reads; award_points invalidates on writes
+RANK_CACHE_TTL = 60
+
+# Achievements shown per page; only this first page is cached, so a write
+# invalidates a fixed set of keys
+ACHIEVEMENTS_PAGE_SIZE = 10
+
 class RankingManager:
     """Main ranking system manager for database operations"""
     
@@ -24,6 +36,15 @@ class RankingManager:
         self.db_path = db_path or DB_PATH
         self.point_system = EnhancedPointSystem()
         self.achievement_system = EnhancedAchievementSystem()
+        self._local = threading.local()
+    
+    def _read_connection(self) -> sqlite3.Connection:
+        """Per-thread connection for read-only lookups, opened once and reused"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            self._local.conn = conn
+        return conn
     
     def initialize_user_ranking(self, user_id: int) -> bool:
         """Initialize ranking data for a new user"""
@@ -85,7 +106,9 @@ class RankingManager:
                 self._update_user_rank(cursor, user_id)
                 
                 conn.commit()
-                return True, points
+            
+            self._invalidate_user_cache(user_id)
+            return True, points
                 
         except Exception as e:
             logger.error(f"Error awarding points to user {user_id}: {e}")
@@ -94,88 +117,139 @@ class RankingManager:
     def get_user_rank(self, user_id: int) -> Optional[UserRank]:
         """Get user's current ranking information"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Get user ranking data
-                cursor.execute("""
-                    SELECT ur.total_points, ur.current_rank_id, ur.consecutive_days,
-                           rd.rank_name, rd.rank_emoji, rd.min_points, rd.max_points,
-                           rd.special_perks, rd.is_special
-                    FROM user_rankings ur
-                    JOIN rank_definitions rd ON ur.current_rank_id = rd.rank_id
-                    WHERE ur.user_id = ?
-                """, (user_id,))
-                
-                result = cursor.fetchone()
-                if not result:
-                    return None
-                
-                total_points, rank_id, consecutive_days, rank_name, rank_emoji, min_points, max_points, special_perks_json, is_special = result
-                
-                # Parse special perks
-                special_perks = {}
-                if special_perks_json:
-                    try:
-                        import json
-                        special_perks = json.loads(special_perks_json)
-                    except:
-                        special_perks = {}
-                
-                # Calculate points to next rank
-                if max_points:
-                    points_to_next = max_points - total_points
-                    next_rank_points = max_points
-                else:
-                    points_to_next = 0
-                    next_rank_points = total_points
-                
-                return UserRank(
-                    rank_name=rank_name,
-                    rank_emoji=rank_emoji,
-                    total_points=total_points,
-                    points_to_next=max(0, points_to_next),
-                    next_rank_points=next_rank_points,
-                    is_special_rank=bool(is_special),
-                    special_perks=special_perks,
-                    rank_level=rank_id,
-                    streak_days=consecutive_days or 0
-                )
-                
+            return self._load_user_rank(user_id)
         except Exception as e:
             logger.error(f"Error getting user rank for {user_id}: {e}")
             return None
     
-    def get_user_achievements(self, user_id: int, limit: int = 20) -> list:
-        """Get user's achievements"""
+    def get_user_achievements(self, user_id: int, limit: Optional[int] = None, offset: int = 0) -> list:
+        """Get user's achievements, newest first (all of them unless limit is given)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT achievement_type, achievement_name, achievement_description,
-                           points_awarded, is_special, achieved_at
-                    FROM user_achievements
-                    WHERE user_id = ?
-                    ORDER BY achieved_at DESC
-                    LIMIT ?
-                """, (user_id, limit))
-                
-                achievements = []
-                for row in cursor.fetchall():
-                    achievements.append({
-                        'type': row[0],
-                        'name': row[1],
-                        'description': row[2],
-                        'points': row[3],
-                        'is_special': bool(row[4]),
-                        'date': row[5]
-                    })
-                
-                return achievements
+            return self._load_user_achievements(user_id, limit, offset)
         except Exception as e:
             logger.error(f"Error getting achievements for user {user_id}: {e}")
             return []
     
+    def get_user_achievement_count(self, user_id: int) -> int:
+        """Get the number of achievements a user has unlocked"""
+        try:
+            return self._load_user_achievement_count(user_id)
+        except Exception as e:
+            logger.error(f"Error counting achievements for user {user_id}: {e}")
+            return 0
+    
+    # Cached loaders behind the getters above. They raise on database errors,
+    # so a failed read is never cached.
+    
+    @cached(lambda self, user_id: f"user:rank:{user_id}", RANK_CACHE_TTL,
+            encode=asdict, decode=lambda data: UserRank(**data))
+    def _load_user_rank(self, user_id: int) -> Optional[UserRank]:
+        conn = self._read_connection()
+        
+        # Get user ranking data
+        result = conn.execute("""
+            SELECT ur.total_points, ur.current_rank_id, ur.consecutive_days,
+                   rd.rank_name, rd.rank_emoji, rd.min_points, rd.max_points,
+                   rd.special_perks, rd.is_special
+            FROM user_rankings ur
+            JOIN rank_definitions rd ON ur.current_rank_id = rd.rank_id
+            WHERE ur.user_id = ?
+        """, (user_id,)).fetchone()
+        
+        if not result:
+            return None
+        
+        total_points, rank_id, consecutive_days, rank_name, rank_emoji, min_points, max_points, special_perks_json, is_special = result
+        
+        # Parse special perks
+        special_perks = {}
+        if special_perks_json:
+            try:
+                import json
+                special_perks = json.loads(special_perks_json)
+            except:
+                special_perks = {}
+        
+        # Calculate points to next rank
+        if max_points:
+            points_to_next = max_points - total_points
+            next_rank_points = max_points
+        else:
+            points_to_next = 0
+            next_rank_points = total_points
+        
+        return UserRank(
+            rank_name=rank_name,
+            rank_emoji=rank_emoji,
+            total_points=total_points,
+            points_to_next=max(0, points_to_next),
+            next_rank_points=next_rank_points,
+            is_special_rank=bool(is_special),
+            special_perks=special_perks,
+            rank_level=rank_id,
+            streak_days=consecutive_days or 0
+        )
+    
+    @cached(lambda self, user_id, limit, offset: (
+                f"user:ach:{user_id}" if (limit, offset) == (ACHIEVEMENTS_PAGE_SIZE, 0) else None
+            ), RANK_CACHE_TTL)
+    def _load_user_achievements(self, user_id: int, limit: Optional[int], offset: int) -> list:
+        conn = self._read_connection()
+        query = """
+            SELECT achievement_type, achievement_name, achievement_description,
+                   points_awarded, is_special, achieved_at
+            FROM user_achievements
+            WHERE user_id = ?
+            ORDER BY achieved_at DESC
+        """
+        params = [user_id]
+        
+        # Page in SQL so only the rows that are shown get fetched
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit if limit is not None else -1, offset])
+        
+        achievements = []
+        for row in conn.execute(query, params).fetchall():
+            achievements.append({
+                'type': row[0],
+                'name': row[1],
+                'description': row[2],
+                'points': row[3],
+                'is_special': bool(row[4]),
+                'date': row[5]
+            })
+        
+        return achievements
+    
+    @cached(lambda self, user_id: f"user:achcount:{user_id}", RANK_CACHE_TTL)
+    def _load_user_achievement_count(self, user_id: int) -> int:
+        conn = self._read_connection()
+        return conn.execute("SELECT COUNT(1) FROM user_achievements WHERE user_id = ?", (user_id,)).fetchone()[0]
+    
+    # Async variants for use from Telegram handlers. sqlite3 blocks, so each
+    # call runs on the default executor instead of stalling the event loop.
+    
+    async def initialize_user_ranking_async(self, user_id: int) -> bool:
+        """Async variant of initialize_user_ranking"""
+        return await asyncio.to_thread(self.initialize_user_ranking, user_id)
+    
+    async def get_user_rank_async(self, user_id: int) -> Optional[UserRank]:
+        """Async variant of get_user_rank"""
+        return await asyncio.to_thread(self.get_user_rank, user_id)
+    
+    async def get_user_achievements_async(self, user_id: int, limit: Optional[int] = None, offset: int = 0) -> list:
+        """Async variant of get_user_achievements"""
+        return await asyncio.to_thread(self.get_user_achievements, user_id, limit, offset)
+    
+    async def get_user_achievement_count_async(self, user_id: int) -> int:
+        """Async variant of get_user_achievement_count"""
+        return await asyncio.to_thread(self.get_user_achievement_count, user_id)
+    
+    def _invalidate_user_cache(self, user_id: int):
+        """Drop cached ranking reads after the user's points change"""
+        cache.delete(f"user:rank:{user_id}", f"user:ach:{user_id}", f"user:achcount:{user_id}")
+    
     def _update_user_rank(self, cursor, user_id: int):
         """Update user's rank based on points"""
         try:
@@ -135,18 +135,13 @@ def get_recent_posts(limit=10):
         return cursor.fetchall()
 
 def get_post_by_id(post_id):
-    """Get a specific post by ID with comment count"""
+    """Get a specific post by ID, including its maintained comment_count"""
     with sqlite3.connect(DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
-            SELECT p.*, 
-                   COALESCE(c.comment_count, 0) as comment_count
+            SELECT p.*
             FROM posts p
-            LEFT JOIN (
-                SELECT post_id, COUNT(*) as comment_count
-                FROM comments
-                GROUP BY post_id
-            ) c ON p.post_id = c.post_id
             WHERE p.post_id = ?
         ''', (post_id,))
         return cursor.fetchone()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script to verify comment deep links land on the right page
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+sys.path.append('.')
+
+# Work on a throwaway SQLite database, never the bot's own
+_TEST_DB = os.path.join(tempfile.mkdtemp(), "navigation_test.db")
+os.environ["DB_PATH"] = _TEST_DB
+os.environ["USE_POSTGRESQL"] = "false"
+
+# Just the columns the comment paths read and write
+_SCHEMA = """
+CREATE TABLE users (
+    user_id INTEGER PRIMARY KEY,
+    comments_posted INTEGER DEFAULT 0
+);
+CREATE TABLE posts (
+    post_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content TEXT,
+    approved INTEGER DEFAULT NULL,
+    comment_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE comments (
+    comment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    parent_comment_id INTEGER,
+    timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+    likes INTEGER DEFAULT 0,
+    dislikes INTEGER DEFAULT 0,
+    flagged INTEGER DEFAULT 0,
+    parent_content_snippet TEXT,
+    parent_timestamp TEXT,
+    FOREIGN KEY(post_id) REFERENCES posts(post_id),
+    FOREIGN KEY(user_id) REFERENCES users(user_id),
+    FOREIGN KEY(parent_comment_id) REFERENCES comments(comment_id)
+);
+INSERT INTO users (user_id) VALUES (1);
+INSERT INTO posts (post_id, content, approved) VALUES (1, 'Navigation test post', 1);
+"""
+
+def _seed_thread():
+    """Create a post whose comments span several pages, ending in a reply to a reply"""
+    from comments import save_comment
+    from config import COMMENTS_PER_PAGE
+
+    with sqlite3.connect(_TEST_DB) as conn:
+        conn.executescript(_SCHEMA)
+
+    # Fill two pages with top-level comments, then reply to the first one
+    comment_ids = []
+    for i in range(COMMENTS_PER_PAGE * 2):
+        comment_id, error = save_comment(1, f"Top-level comment {i}", 1)
+        if error:
+            raise RuntimeError(error)
+        comment_ids.append(comment_id)
+
+    reply_id, error = save_comment(1, "Reply on a later page", 1, comment_ids[0])
+    if error:
+        raise RuntimeError(error)
+    nested_reply_id, error = save_comment(1, "Reply to the reply", 1, reply_id)
+    if error:
+        raise RuntimeError(error)
+
+    return comment_ids, reply_id, nested_reply_id
+
+def _check_lands_on_page(comment_id, label):
+    """Check find_comment_page points at a page that actually lists the comment"""
+    from comments import find_comment_page, get_comments_paginated
+
+    navigation = find_comment_page(comment_id)
+    if not navigation:
+        print(f"❌ No page found for {label}")
+        return False
+
+    comments, _, _, _ = get_comments_paginated(navigation['post_id'], navigation['page'])
+    if comment_id not in [comment['comment_id'] for comment in comments]:
+        print(f"❌ {label} is not on page {navigation['page']}")
+        return False
+
+    print(f"✅ {label} found on page {navigation['page']}")
+    return navigation['page']
+
+def test_reply_deep_link():
+    """Test that a reply past the first page links to its own page"""
+    try:
+        comment_ids, reply_id, nested_reply_id = _seed_thread()
+
+        if not _check_lands_on_page(comment_ids[0], "Top-level comment"):
+            return False
+
+        reply_page = _check_lands_on_page(reply_id, "Reply")
+        if not reply_page:
+            return False
+        if reply_page < 2:
+            print(f"❌ Reply should be past page 1, got page {reply_page}")
+            return False
+
+        if not _check_lands_on_page(nested_reply_id, "Reply to a reply"):
+            return False
+
+        return True
+    except Exception as e:
+        print(f"❌ Reply deep link test error: {e}")
+        return False
+
+def test_missing_comment():
+    """Test that an unknown comment has no page"""
+    try:
+        from comments import find_comment_page
+
+        if find_comment_page(999999) is None:
+            print("✅ Unknown comment has no page")
+            return True
+
+        print("❌ Unknown comment resolved to a page")
+        return False
+    except Exception as e:
+        print(f"❌ Missing comment test error: {e}")
+        return False
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Comment Navigation")
+    print("=" * 40)
+
+    tests = [
+        ("Reply Deep Link Test", test_reply_deep_link),
+        ("Missing Comment Test", test_missing_comment)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        if test_func():
+            print(f"✅ {test_name} - PASSED")
+            passed += 1
+        else:
+            print(f"❌ {test_name} - FAILED")
+
+    print(f"\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("🎉 All tests passed! Comment links open the right page.")
+        return True
+    else:
+        print("⚠️ Some tests failed. Please check the issues above.")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -27,11 +27,12 @@ def test_imports():
 def test_menu_structure():
     """Test if the menu buttons are correctly configured"""
     try:
-        from enhanced_ranking_ui import show_enhanced_ranking_menu
-        import inspect
+        from enhanced_ranking_ui import build_rank_menu_markup
         
-        # Get the source code to check button configuration
-        source = inspect.getsource(show_enhanced_ranking_menu)
+        # Inspect the menu keyboard itself
+        buttons = [button for row in build_rank_menu_markup().inline_keyboard for button in row]
+        labels = [button.text for button in buttons]
+        callbacks = [button.callback_data for button in buttons]
         
         expected_buttons = [
             "🪜 Rank Ladder",
@@ -42,7 +43,7 @@ def test_menu_structure():
         ]
         
         for button in expected_buttons:
-            if button in source:
+            if button in labels:
                 print(f"✅ Found button: {button}")
             else:
                 print(f"❌ Missing button: {button}")
@@ -58,7 +59,7 @@ def test_menu_structure():
         ]
         
         for callback in expected_callbacks:
-            if callback in source:
+            if callback in callbacks:
                 print(f"✅ Found callback: {callback}")
             else:
                 print(f"❌ Missing callback: {callback}")
@@ -72,10 +73,10 @@ def test_menu_structure():
 def test_callback_handlers():
     """Test if callback handlers are properly configured"""
     try:
-        from enhanced_ranking_ui import enhanced_ranking_callback_handler
-        import inspect
+        from enhanced_ranking_ui import handled_callbacks
         
-        source = inspect.getsource(enhanced_ranking_callback_handler)
+        # Check the dispatch table itself; the handlers are not executed
+        handled = handled_callbacks()
         
         expected_handlers = [
             "rank_ladder",
@@ -85,7 +86,7 @@ def test_callback_handlers():
         ]
         
         for handler in expected_handlers:
-            if f'data == "{handler}"' in source or f'data.startswith("{handler}")' in source:
+            if handler in handled:
                 print(f"✅ Found handler for: {handler}")
             else:
                 print(f"❌ Missing handler for: {handler}")
@@ -99,10 +100,10 @@ def test_callback_handlers():
 def test_point_guide():
     """Test if the point guide function is properly implemented"""
     try:
-        from enhanced_ranking_ui import show_point_guide
-        import inspect
+        from enhanced_ranking_ui import build_point_guide
         
-        source = inspect.getsource(show_point_guide)
+        # Check the rendered guide text
+        source = build_point_guide()
         
         # Check for essential content
         essential_content = [
@@ -129,13 +130,12 @@ def test_point_guide():
 def test_rank_ladder():
     """Test if the rank ladder function is properly implemented"""
     try:
-        from rank_ladder import show_rank_ladder
-        import inspect
+        from rank_ladder import build_ladder_markup
         
-        source = inspect.getsource(show_rank_ladder)
+        callbacks = [button.callback_data for row in build_ladder_markup().inline_keyboard for button in row]
         
         # Check for correct callback
-        if 'enhanced_ranking' in source:
+        if 'enhanced_ranking' in callbacks:
             print("✅ Rank ladder has correct back button callback")
         else:
             print("❌ Rank ladder has incorrect back button callback")
@@ -56,18 +56,16 @@ def is_spam(text):
     
     return False
 
+# Characters that need escaping in MarkdownV2 (backslash included), matched in one pass
+_MARKDOWN_V2_SPECIAL = re.compile(r'([\\_*\[\]()~`>#+\-=|{}.!])')
+
 def escape_markdown_text(text):
     """Escape text for MarkdownV2"""
     if not text:
         return ""
     # Convert to string if it's not already a string
     text = str(text)
-    # List of characters that need escaping in MarkdownV2
-    # Note: order matters for some characters
-    escape_chars = ['\\', '_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    for char in escape_chars:
-        text = text.replace(char, f'\\{char}')
-    return text
+    return _MARKDOWN_V2_SPECIAL.sub(r'\\\1', text)
 
 def escape_html_text(text):
     """Escape text for HTML parse mode"""